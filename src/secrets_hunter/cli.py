@@ -79,6 +79,40 @@ scan_args = {
         "default": CLIDefaults.MAX_WORKERS,
         "help": f"number of parallel workers (default: {CLIDefaults.MAX_WORKERS})"
     },
+    "--pattern-engine": {
+        "type": str,
+        "choices": ['loop', 'combined'],
+        "default": CLIDefaults.PATTERN_ENGINE,
+        "help": f"secret pattern matching engine (default: {CLIDefaults.PATTERN_ENGINE})"
+    },
+    "--scan-engine": {
+        "type": str,
+        "choices": ['line', 'buffer'],
+        "default": CLIDefaults.SCAN_ENGINE,
+        "help": f"read sources line by line or scan whole buffers at once (default: {CLIDefaults.SCAN_ENGINE})"
+    },
+    "--executor": {
+        "type": str,
+        "choices": ['thread', 'process'],
+        "default": CLIDefaults.EXECUTOR,
+        "help": f"run workers as threads or processes (default: {CLIDefaults.EXECUTOR})"
+    },
+    "--walk-workers": {
+        "type": int,
+        "default": CLIDefaults.WALK_WORKERS,
+        "help": f"number of threads listing directories (default: {CLIDefaults.WALK_WORKERS})"
+    },
+    "--respect-gitignore": {
+        "action": "store_true",
+        "default": CLIDefaults.RESPECT_GITIGNORE,
+        "help": "skip files ignored by git when scanning a git work tree"
+    },
+    "--line-window-size": {
+        "type": int,
+        "default": CLIDefaults.LINE_WINDOW_SIZE,
+        "help": f"scan lines longer than this in overlapping windows of this many characters "
+                f"of decoded text, not bytes (default: {CLIDefaults.LINE_WINDOW_SIZE})"
+    },
     "--git-revset": {
         "type": str,
         "default": None,
@@ -91,6 +125,11 @@ scan_args = {
         "metavar": "N",
         "help": "limit number of commits selected by --git-revset"
     },
+    "--git-added-lines-only": {
+        "action": "store_true",
+        "default": CLIDefaults.GIT_ADDED_LINES_ONLY,
+        "help": "scan only the lines added by each commit and the PEM blocks around them, not whole blobs"
+    },
     "--domain": {
         "type": str,
         "default": None,
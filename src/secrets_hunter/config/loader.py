@@ -6,6 +6,7 @@ from importlib.resources import files as res_files
 from pathlib import Path
 from typing import Any
 
+from secrets_hunter.config.pattern_anchors import derive_secret_pattern_anchors
 from secrets_hunter.models.config import ExcludePattern, RuntimeConfig
 
 FLAG_MAP: dict[str, int] = {
@@ -219,6 +220,7 @@ def load_runtime_config(user_configs: list[str | Path] | None = None) -> Runtime
 
     return RuntimeConfig(
         secret_patterns=compiled_secret_patterns,
+        secret_pattern_anchors=derive_secret_pattern_anchors(compiled_secret_patterns),
         exclude_patterns=compiled_exclude_patterns,
         exclude_keywords=exclude_keywords,
         secret_keywords=secret_keywords,
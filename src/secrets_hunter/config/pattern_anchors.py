@@ -0,0 +1,133 @@
+import re
+
+from re import _parser
+
+# Case-insensitive anchors are matched against casefolded text. Non-ASCII
+# literals and "i" are left out because re folds them (e.g. "ı" matches "i")
+# in ways casefold() does not reproduce.
+_FOLD_UNSAFE = frozenset("iI")
+
+MAX_ANCHOR_ALTERNATIVES = 16
+
+_REPEATS = (_parser.MAX_REPEAT, _parser.MIN_REPEAT, _parser.POSSESSIVE_REPEAT)
+
+Clause = tuple[str, ...]
+
+
+def _usable_literal(code: int, ignorecase: bool) -> bool:
+    if not ignorecase:
+        return True
+
+    ch = chr(code)
+    return ch.isascii() and ch not in _FOLD_UNSAFE
+
+
+def _best_clause(clauses: list[Clause]) -> Clause:
+    """Pick the clause whose shortest alternative is the longest."""
+    if not clauses:
+        return ()
+
+    return max(clauses, key=lambda c: (min(len(a) for a in c), -len(c)))
+
+
+def _literal_alternatives(branch, ignorecase: bool) -> list[str] | None:
+    """Return the branch alternatives as plain strings, or None if any is not a plain literal."""
+    alternatives: list[str] = []
+
+    for alt in branch[1]:
+        if not alt or any(op is not _parser.LITERAL or not _usable_literal(av, ignorecase) for op, av in alt):
+            return None
+
+        alternatives.append("".join(chr(av) for _, av in alt))
+
+    return alternatives
+
+
+def _required_clauses(items, ignorecase: bool) -> list[Clause]:
+    """
+    Collect literal clauses that every match of the parsed items must contain.
+    A clause is satisfied when at least one of its alternatives is present.
+    """
+    clauses: list[Clause] = []
+    run: list[str] = [""]
+
+    def flush() -> None:
+        nonlocal run
+
+        if run[0]:
+            clauses.append(tuple(dict.fromkeys(run)))
+
+        run = [""]
+
+    for op, av in items:
+        if op is _parser.LITERAL and _usable_literal(av, ignorecase):
+            run = [r + chr(av) for r in run]
+            continue
+
+        # zero-width assertions (\b, ^, $) keep neighbouring literals adjacent
+        if op is _parser.AT:
+            continue
+
+        if op is _parser.BRANCH:
+            literal_alternatives = _literal_alternatives(av, ignorecase)
+
+            # (?:live|test) extends the current run into one run per alternative
+            if literal_alternatives and len(run) * len(literal_alternatives) <= MAX_ANCHOR_ALTERNATIVES:
+                run = [r + alt for r in run for alt in literal_alternatives]
+                continue
+
+        flush()
+
+        if op is _parser.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+
+            if not (add_flags or del_flags):
+                clauses.extend(_required_clauses(sub, ignorecase))
+
+        elif op is _parser.BRANCH:
+            alternatives: list[str] = []
+
+            for alt in av[1]:
+                best = _best_clause(_required_clauses(alt, ignorecase))
+
+                if not best:
+                    alternatives = []
+                    break
+
+                alternatives.extend(best)
+
+            if alternatives:
+                clauses.append(tuple(dict.fromkeys(alternatives)))
+
+        elif op in _REPEATS and av[0] >= 1:
+            clauses.extend(_required_clauses(av[2], ignorecase))
+
+    flush()
+    return clauses
+
+
+def derive_pattern_anchors(pattern: re.Pattern) -> Clause:
+    """
+    Return literals of which at least one occurs in any string the pattern
+    can match. An empty tuple means the pattern has no usable anchor.
+    Anchors of case-insensitive patterns are casefolded.
+    """
+    if not isinstance(pattern.pattern, str):
+        return ()
+
+    try:
+        parsed = _parser.parse(pattern.pattern, pattern.flags)
+    except re.error:
+        return ()
+
+    ignorecase = bool(parsed.state.flags & re.IGNORECASE)
+    anchors = _best_clause(_required_clauses(parsed, ignorecase))
+
+    if ignorecase:
+        anchors = tuple(dict.fromkeys(a.casefold() for a in anchors))
+
+    return anchors
+
+
+def derive_secret_pattern_anchors(secret_patterns: dict[str, re.Pattern]) -> dict[str, Clause]:
+    return {name: derive_pattern_anchors(pattern) for name, pattern in secret_patterns.items()}
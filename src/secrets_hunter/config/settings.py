@@ -35,10 +35,35 @@ DB_URI_RE = re.compile(
 )
 
 class FileSettings:
-    MAX_LINE_LENGTH = 50000
+    # Lines with a run of this many identical characters are scanned in windows, without the run
     MAX_REPEAT_RUN = 1000
+    # Smaller files are scanned without checking for identical copies, as hashing costs about as much
+    DEDUP_MIN_FILE_SIZE = 4096
+    # Characters shared by consecutive windows of a long line
+    LINE_WINDOW_OVERLAP = 1024
     BINARY_DETECTION_CHUNK_SIZE = 2048
     CONTROL_CHARS_RATIO_THRESHOLD = 0.05
+    # Files of at least this many bytes are scanned through a memory map by the buffer engine
+    MMAP_MIN_FILE_SIZE = 4 * 1024 * 1024
+    # Bytes of a mapped file checked at a time for content that must be decoded
+    MMAP_CHECK_CHUNK_SIZE = 1024 * 1024
+
+
+class DetectionSettings:
+    VERDICT_CACHE_SIZE = 65536
+    # Shorter keyword lists are matched with substring checks, which beat walking an automaton in Python
+    KEYWORD_AUTOMATON_MIN_KEYWORDS = 32
+
+
+class BatchSettings:
+    # Bytes of source targeted per batch of work items
+    BATCH_BYTES = 1024 * 1024
+    # Cost, in bytes, charged per item on top of its size
+    ITEM_OVERHEAD_BYTES = 4096
+    # Batches are kept small enough to give every worker this many of them
+    MIN_BATCHES_PER_WORKER = 4
+    # Submitted batches allowed per worker before discovery waits for results
+    MAX_IN_FLIGHT_PER_WORKER = 2
 
 
 class CLIDefaults:
@@ -52,6 +77,14 @@ class CLIDefaults:
     TRUNCATE_LONG_MATCHES = False
     SKIP_TLS_VERIFY = False
     LOG_LEVEL = "INFO"
+    PATTERN_ENGINE = "loop"
+    SCAN_ENGINE = "line"
+    EXECUTOR = "thread"
+    WALK_WORKERS = 1
+    RESPECT_GITIGNORE = False
+    GIT_ADDED_LINES_ONLY = False
+    # Lines longer than this are scanned in windows of this many characters
+    LINE_WINDOW_SIZE = 50000
 
 
 @dataclass
@@ -67,8 +100,15 @@ class CLIArgs:
     log_level: str = CLIDefaults.LOG_LEVEL
     git_revset: str | None = None
     git_max_count: int | None = None
+    git_added_lines_only: bool = CLIDefaults.GIT_ADDED_LINES_ONLY
     domain: str | None = None
     skip_tls_verify: bool = CLIDefaults.SKIP_TLS_VERIFY
+    pattern_engine: str = CLIDefaults.PATTERN_ENGINE
+    scan_engine: str = CLIDefaults.SCAN_ENGINE
+    executor: str = CLIDefaults.EXECUTOR
+    walk_workers: int = CLIDefaults.WALK_WORKERS
+    respect_gitignore: bool = CLIDefaults.RESPECT_GITIGNORE
+    line_window_size: int = CLIDefaults.LINE_WINDOW_SIZE
 
     @classmethod
     def from_argparse(cls, args):
@@ -84,6 +124,13 @@ class CLIArgs:
             log_level=args.log_level,
             git_revset=args.git_revset,
             git_max_count=args.git_max_count,
+            git_added_lines_only=args.git_added_lines_only,
             domain=args.domain,
-            skip_tls_verify=args.skip_tls_verify
+            skip_tls_verify=args.skip_tls_verify,
+            pattern_engine=args.pattern_engine,
+            scan_engine=args.scan_engine,
+            executor=args.executor,
+            walk_workers=args.walk_workers,
+            respect_gitignore=args.respect_gitignore,
+            line_window_size=args.line_window_size
         )
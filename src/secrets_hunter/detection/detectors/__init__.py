@@ -1,9 +1,11 @@
 from .base import BaseDetector
+from .combined_pattern_detector import CombinedPatternDetector
 from .entropy_detector import EntropyDetector
 from .pattern_detector import PatternDetector
 
 __all__ = [
     "BaseDetector",
+    "CombinedPatternDetector",
     "EntropyDetector",
     "PatternDetector"
 ]
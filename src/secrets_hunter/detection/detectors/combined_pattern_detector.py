@@ -0,0 +1,85 @@
+import re
+
+from secrets_hunter.detection.detectors.pattern_detector import PatternDetector
+
+SCOPED_FLAGS: dict[int, str] = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+    re.ASCII: "a",
+}
+
+
+class CombinedPatternDetector(PatternDetector):
+    """
+    Detects secrets by scanning each fragment once with a single alternation
+    of all secret patterns, one named group per pattern.
+
+    A regex pass reports non-overlapping matches only, so a pattern whose match
+    overlaps another pattern's match is missed by the alternation. When the
+    combined pass hits, the remaining patterns are re-checked one by one, which
+    keeps the findings identical to PatternDetector. Patterns that cannot be
+    embedded in an alternation (capturing groups, inline global flags) are
+    always matched on their own.
+    """
+
+    def __init__(self, secret_patterns, secret_pattern_anchors=None):
+        super().__init__(secret_patterns, secret_pattern_anchors)
+        self._group_names: dict[str, str] = {}
+        self._standalone: set[str] = set()
+        alternatives: list[str] = []
+
+        for i, (secret_type, pattern) in enumerate(self._ordered_patterns):
+            group_name = f"p{i}"
+            alternative = self._as_alternative(group_name, pattern)
+
+            if alternative is None:
+                self._standalone.add(secret_type)
+                continue
+
+            self._group_names[group_name] = secret_type
+            alternatives.append(alternative)
+
+        self._combined = re.compile("|".join(alternatives)) if alternatives else None
+
+    @staticmethod
+    def _as_alternative(group_name: str, pattern: re.Pattern) -> str | None:
+        if not isinstance(pattern.pattern, str) or pattern.groups:
+            return None
+
+        flags = "".join(letter for flag, letter in SCOPED_FLAGS.items() if pattern.flags & flag)
+        body = pattern.pattern
+
+        # a trailing verbose comment would otherwise swallow the closing parentheses
+        if pattern.flags & re.VERBOSE:
+            body += "\n"
+
+        alternative = f"(?P<{group_name}>(?{flags}:{body}))" if flags else f"(?P<{group_name}>{body})"
+
+        try:
+            re.compile(alternative)
+        except re.error:
+            return None
+
+        return alternative
+
+    def match_secret_types(self, content: str) -> list[str]:
+        matched: set[str] = set()
+
+        if self._combined is not None:
+            for match in self._combined.finditer(content):
+                matched.add(self._group_names[match.lastgroup])
+
+        for secret_type, pattern in self.candidate_patterns(content):
+            if secret_type in matched:
+                continue
+
+            # without a combined hit there is no match for an overlapping pattern to hide behind
+            if (secret_type in self._standalone or matched) and pattern.search(content):
+                matched.add(secret_type)
+
+        if not matched:
+            return []
+
+        return [secret_type for secret_type, _ in self._ordered_patterns if secret_type in matched]
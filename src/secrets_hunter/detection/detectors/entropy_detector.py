@@ -16,6 +16,59 @@ class EntropyDetector(BaseDetector):
         self.cli_args = cli_args
         self.ignore_prefixes = re.compile(r'^(?:sha\d+|md5)[-:]', re.IGNORECASE)
 
+    def classify(self, content: str) -> str | None:
+        """Return the high entropy string type of a candidate, or None."""
+        cleaned = self.ignore_prefixes.sub('', content)
+
+        is_hex = entropy_utils.is_hex_string(cleaned)
+        is_base64 = entropy_utils.is_base64_string(cleaned)
+        is_base64url = entropy_utils.is_base64url_string(cleaned)
+
+        if not (is_hex or is_base64 or is_base64url):
+            return None
+
+        max_entropy = entropy_utils.max_possible_entropy(cleaned)
+        can_match_hex = is_hex and max_entropy >= self.cli_args.hex_entropy_threshold
+        can_match_b64 = (
+            (is_base64 or is_base64url)
+            and max_entropy >= self.cli_args.b64_entropy_threshold
+        )
+
+        if not can_match_hex and not can_match_b64:
+            return None
+
+        entropy = entropy_utils.calculate_shannon_entropy(cleaned)
+
+        if is_hex and entropy >= self.cli_args.hex_entropy_threshold:
+            return "High Entropy Hex String"
+        elif (is_base64 or is_base64url) and entropy >= self.cli_args.b64_entropy_threshold:
+            return "High Entropy Base64 String"
+
+        return None
+
+    def create_finding(
+        self,
+        string_type: str,
+        fragment: LineFragment,
+        line: str,
+        line_num: int,
+        filepath: str
+    ) -> Finding:
+        file = self.format_filepath(filepath)
+        return Finding(
+            title=f"Hardcoded {string_type} at {file}:{line_num}",
+            file=file,
+            line=line_num,
+            severity=Severity.LOW,
+            type=string_type,
+            fragment=fragment,
+            match=fragment.content,
+            context=line.strip()[:100],
+            detection_method=DetectionMethod.ENTROPY,
+            confidence=Confidence.HIGH_ENTROPY_NO_ASSIGNMENT_CONTEXT,
+            confidence_reasoning="High Entropy without assignment context"
+        )
+
     def detect(
         self,
         line: str,
@@ -26,54 +79,11 @@ class EntropyDetector(BaseDetector):
         findings = []
 
         for fragment in fragments:
-            cleaned = self.ignore_prefixes.sub('', fragment.content)
-
-            is_hex = entropy_utils.is_hex_string(cleaned)
-            is_base64 = entropy_utils.is_base64_string(cleaned)
-            is_base64url = entropy_utils.is_base64url_string(cleaned)
-
-            if not (is_hex or is_base64 or is_base64url):
-                continue
-
-            max_entropy = entropy_utils.max_possible_entropy(cleaned)
-            can_match_hex = is_hex and max_entropy >= self.cli_args.hex_entropy_threshold
-            can_match_b64 = (
-                (is_base64 or is_base64url)
-                and max_entropy >= self.cli_args.b64_entropy_threshold
-            )
-
-            if not can_match_hex and not can_match_b64:
-                continue
-
-            entropy = entropy_utils.calculate_shannon_entropy(cleaned)
-
-            is_high_entropy = False
-            string_type = None
-
-            if is_hex and entropy >= self.cli_args.hex_entropy_threshold:
-                is_high_entropy = True
-                string_type = "High Entropy Hex String"
-            elif (is_base64 or is_base64url) and entropy >= self.cli_args.b64_entropy_threshold:
-                is_high_entropy = True
-                string_type = "High Entropy Base64 String"
+            string_type = self.classify(fragment.content)
 
-            if not is_high_entropy:
+            if string_type is None:
                 continue
 
-            file = self.format_filepath(filepath)
-
-            findings.append(Finding(
-                title=f"Hardcoded {string_type} at {file}:{line_num}",
-                file=file,
-                line=line_num,
-                severity=Severity.LOW,
-                type=string_type,
-                fragment=fragment,
-                match=fragment.content,
-                context=line.strip()[:100],
-                detection_method=DetectionMethod.ENTROPY,
-                confidence=Confidence.HIGH_ENTROPY_NO_ASSIGNMENT_CONTEXT,
-                confidence_reasoning="High Entropy without assignment context"
-            ))
+            findings.append(self.create_finding(string_type, fragment, line, line_num, filepath))
 
         return findings
@@ -1,5 +1,6 @@
 import re
 
+from secrets_hunter.config.pattern_anchors import derive_pattern_anchors
 from secrets_hunter.detection.detectors.base import BaseDetector
 from secrets_hunter.detection.fragmenter import LineFragment
 from secrets_hunter.models import Finding, DetectionMethod, Severity, Confidence
@@ -8,11 +9,84 @@ from secrets_hunter.models import Finding, DetectionMethod, Severity, Confidence
 class PatternDetector(BaseDetector):
     """Detects secrets using regex patterns"""
 
-    def __init__(self, secret_patterns):
+    def __init__(self, secret_patterns, secret_pattern_anchors=None):
         super().__init__()
         self.secret_patterns = secret_patterns
+        self._ordered_patterns = list(secret_patterns.items())
+        self._unanchored: list[int] = []
+        self._anchor_index: dict[str, list[int]] = {}
+        self._folded_anchor_index: dict[str, list[int]] = {}
 
-    def _create_finding(
+        anchors_by_name = secret_pattern_anchors or {}
+
+        for i, (name, pattern) in enumerate(self._ordered_patterns):
+            anchors = anchors_by_name.get(name)
+
+            if anchors is None:
+                anchors = derive_pattern_anchors(pattern)
+
+            if not anchors:
+                self._unanchored.append(i)
+                continue
+
+            index = self._folded_anchor_index if pattern.flags & re.IGNORECASE else self._anchor_index
+
+            for anchor in anchors:
+                index.setdefault(anchor, []).append(i)
+
+    @property
+    def has_unanchored_patterns(self) -> bool:
+        return bool(self._unanchored)
+
+    @property
+    def anchors(self) -> list[str]:
+        return list(self._anchor_index)
+
+    @property
+    def folded_anchors(self) -> list[str]:
+        return list(self._folded_anchor_index)
+
+    def contains_anchor(self, content: str) -> bool:
+        if any(anchor in content for anchor in self._anchor_index):
+            return True
+
+        if self._folded_anchor_index:
+            folded = content.casefold()
+            return any(anchor in folded for anchor in self._folded_anchor_index)
+
+        return False
+
+    def candidate_patterns(self, content: str) -> list[tuple[str, re.Pattern]]:
+        """Patterns that can match content: unanchored ones plus those whose anchor occurs in it."""
+        selected = set(self._unanchored)
+
+        for anchor, ids in self._anchor_index.items():
+            if anchor in content:
+                selected.update(ids)
+
+        if self._folded_anchor_index:
+            folded = content.casefold()
+
+            for anchor, ids in self._folded_anchor_index.items():
+                if anchor in folded:
+                    selected.update(ids)
+
+        return [self._ordered_patterns[i] for i in sorted(selected)]
+
+    def match_secret_types(self, content: str) -> list[str]:
+        return [
+            secret_type
+            for secret_type, pattern in self.candidate_patterns(content)
+            if pattern.search(content)
+        ]
+
+    def fragment_secret_types(self, fragment: LineFragment) -> list[str]:
+        if fragment.special_finding_type:
+            return [fragment.special_finding_type]
+
+        return self.match_secret_types(fragment.content)
+
+    def create_finding(
         self,
         secret_type: str,
         fragment: LineFragment,
@@ -45,14 +119,8 @@ class PatternDetector(BaseDetector):
         findings = []
 
         for fragment in fragments:
-            if fragment.special_finding_type:
-                finding = self._create_finding(fragment.special_finding_type, fragment, line, line_num, filepath)
+            for secret_type in self.fragment_secret_types(fragment):
+                finding = self.create_finding(secret_type, fragment, line, line_num, filepath)
                 findings.append(finding)
-                continue
-
-            for secret_type, pattern in self.secret_patterns.items():
-                if pattern.search(fragment.content):
-                    finding = self._create_finding(secret_type, fragment, line, line_num, filepath)
-                    findings.append(finding)
 
         return findings
@@ -1,14 +1,21 @@
+from dataclasses import replace
 from pathlib import Path
 
 from secrets_hunter.models import Confidence, DetectionMethod, Finding, Severity
 from secrets_hunter.config import STRIP
-from secrets_hunter.models.config import RuntimeConfig
+from secrets_hunter.config.settings import DetectionSettings
+from secrets_hunter.models.config import ExcludePattern, RuntimeConfig
 
 from secrets_hunter.detection.detectors.entropy_detector import EntropyDetector
 from secrets_hunter.detection.detectors.pattern_detector import PatternDetector
 from secrets_hunter.detection.fragmenter.fragmenter import SourceFragmenter
-from secrets_hunter.detection.fragmenter.models import SourceFragment
+from secrets_hunter.detection.fragmenter.line_windows import LineWindower
+from secrets_hunter.detection.fragmenter.models import LineFragment, SourceFragment
 from secrets_hunter.detection.false_positive_validator import FalsePositiveFindingsValidator
+from secrets_hunter.detection.keyword_matcher import KeywordMatcher
+from secrets_hunter.detection.line_gate import LineGate
+from secrets_hunter.detection.stats import DetectionStats
+from secrets_hunter.detection.verdict_cache import CandidateVerdict, VerdictCache
 
 
 class DetectionEngine:
@@ -19,41 +26,96 @@ class DetectionEngine:
         entropy_detector: EntropyDetector,
         source_fragmenter: SourceFragmenter,
         false_positive_validator: FalsePositiveFindingsValidator,
+        line_gate: LineGate | None = None,
+        line_windower: LineWindower | None = None,
+        verdict_cache_size: int = DetectionSettings.VERDICT_CACHE_SIZE,
     ):
         self.runtime_cfg = runtime_cfg
         self.pattern_detector = pattern_detector
         self.entropy_detector = entropy_detector
         self.source_fragmenter = source_fragmenter
         self.false_positive_validator = false_positive_validator
+        self.line_gate = line_gate
+        self.line_windower = line_windower
+        self.secret_keyword_matcher = KeywordMatcher(runtime_cfg.secret_keywords)
+        self.stats = DetectionStats()
+        # the detectors and the validator are fixed for the engine's lifetime,
+        # so a verdict only depends on the candidate itself
+        self.verdict_cache = VerdictCache(verdict_cache_size)
 
     def _is_secret_var(self, v: str) -> tuple[bool, str]:
-        v = v.lower()
+        k = self.secret_keyword_matcher.first_match(v.lower())
 
-        for k in self.runtime_cfg.secret_keywords:
-            if k in v:
-                return True, k
+        if k is not None:
+            return True, k
 
         return False, ""
 
     def scan_fragment(self, source_fragment: SourceFragment, filepath: Path | str) -> list[Finding]:
+        if self.line_windower is not None and self.line_windower.needs_windows(source_fragment):
+            return self._scan_windows(source_fragment, filepath)
+
+        return self._scan_source_fragment(source_fragment, filepath)
+
+    def _scan_windows(self, source_fragment: SourceFragment, filepath: Path | str) -> list[Finding]:
+        """Scan a long fragment window by window; each match is reported once, by a window holding it whole."""
+        self.stats.increment("windowed_lines")
+        findings: list[Finding] = []
+        seen: set[tuple[int, str, str]] = set()
+
+        for window, (owned_start, owned_end) in self.line_windower.windows(source_fragment):
+            for finding in self._scan_source_fragment(window, filepath):
+                offset = window.content.find(finding.match)
+
+                # a match starting outside the owned offsets may be cut, the neighbouring window holds it whole
+                if offset >= 0 and not owned_start <= offset < owned_end:
+                    continue
+
+                key = (finding.line, finding.type, finding.match)
+
+                if key not in seen:
+                    seen.add(key)
+                    findings.append(finding)
+
+        return findings
+
+    def _scan_source_fragment(self, source_fragment: SourceFragment, filepath: Path | str) -> list[Finding]:
         fragment_line = source_fragment.start_line
         fragment_content = source_fragment.content
 
+        # Step 0: Drop fragments that cannot produce a finding
+        if self.line_gate is not None:
+            if not self.line_gate.allows(fragment_content):
+                self.stats.increment("gate_skipped")
+                return []
+
+            self.stats.increment("gate_passed")
+
         # Step 1: Extract all strings from a source fragment
         all_fragments = self.source_fragmenter.extract(source_fragment)
 
         if not all_fragments:
             return []
 
-        # Step 2: Find high entropy strings
-        entropy_findings = self.entropy_detector.detect(
-            fragment_content, fragment_line, str(filepath), all_fragments
-        )
+        # Step 2: Find high entropy and pattern matching strings
+        verdicts = [self._candidate_verdict(fragment) for fragment in all_fragments]
+        filepath = str(filepath)
 
-        # Step 3: Find pattern matching strings
-        pattern_findings = self.pattern_detector.detect(
-            fragment_content, fragment_line, str(filepath), all_fragments
-        )
+        # Step 3: Build findings, pattern findings first
+        entropy_findings = [
+            self.entropy_detector.create_finding(
+                verdict.entropy_type, fragment, fragment_content, fragment_line, filepath
+            )
+            for fragment, verdict in zip(all_fragments, verdicts)
+            if verdict.entropy_type is not None
+        ]
+        pattern_findings = [
+            self.pattern_detector.create_finding(
+                secret_type, fragment, fragment_content, fragment_line, filepath
+            )
+            for fragment, verdict in zip(all_fragments, verdicts)
+            for secret_type in verdict.pattern_types
+        ]
 
         # Step 3.5: prioritize pattern findings (dedupe by match)
         pattern_matches = {f.match for f in pattern_findings if f.match}
@@ -70,12 +132,40 @@ class DetectionEngine:
         assignment_context = self.source_fragmenter.assignment_map(fragment_content)
         return self._process_assignment_context(all_fragment_findings, assignment_context)
 
+    def _candidate_verdict(self, fragment: LineFragment) -> CandidateVerdict:
+        verdict = self.verdict_cache.get(fragment)
+
+        if verdict is not None:
+            self.stats.increment("verdict_cache_hits")
+            return verdict
+
+        self.stats.increment("verdict_cache_misses")
+        verdict = CandidateVerdict(
+            entropy_type=self.entropy_detector.classify(fragment.content),
+            pattern_types=tuple(self.pattern_detector.fragment_secret_types(fragment)),
+        )
+
+        if verdict.has_findings:
+            rejected, rejected_by = self.false_positive_validator.check_rejection_for_fragment(fragment)
+            verdict = replace(verdict, rejected=rejected, rejected_by=rejected_by)
+
+        self.verdict_cache.put(fragment, verdict)
+        return verdict
+
+    def _check_rejection_for_finding_value(self, finding: Finding) -> tuple[bool, ExcludePattern | None]:
+        verdict = self.verdict_cache.get(finding.fragment)
+
+        if verdict is not None and verdict.has_findings:
+            return verdict.rejected, verdict.rejected_by
+
+        return self.false_positive_validator.check_rejection_for_finding_value(finding)
+
     def _process_assignment_context(self, findings: list[Finding], ctx: dict) -> list[Finding]:
         transformed_findings: list[Finding] = []
 
         for finding in findings:
             finding_value_rejected, rejected_by = (
-                self.false_positive_validator.check_rejection_for_finding_value(finding)
+                self._check_rejection_for_finding_value(finding)
             )
             match = finding.match
             norm_match = match.strip().strip(STRIP)
@@ -4,7 +4,8 @@ import re
 from binascii import Error as BinasciiError
 
 from secrets_hunter.config.settings import MIN_PEM_BODY_BYTES
-from secrets_hunter.detection.fragmenter import DBConnectionFragment, PEMKeyFragment
+from secrets_hunter.detection.fragmenter import DBConnectionFragment, LineFragment, PEMKeyFragment
+from secrets_hunter.detection.keyword_matcher import KeywordMatcher
 from secrets_hunter.models import Finding
 from secrets_hunter.models.config import ExcludePattern
 
@@ -25,6 +26,7 @@ class FalsePositiveFindingsValidator:
     def __init__(self, exclude_patterns, exclude_keywords, string_semantics_classifier):
         self.exclude_patterns = exclude_patterns
         self.exclude_keywords = exclude_keywords
+        self.exclude_keyword_matcher = KeywordMatcher(k.lower() for k in exclude_keywords if k)
         self.string_classifier = string_semantics_classifier
 
     @staticmethod
@@ -107,8 +109,7 @@ class FalsePositiveFindingsValidator:
 
         return False, None
 
-    def check_rejection_for_generic_string(self, finding: Finding) -> tuple[bool, ExcludePattern | None]:
-        string = finding.match
+    def check_rejection_for_generic_string(self, string: str) -> tuple[bool, ExcludePattern | None]:
         string_lower = string.lower()
 
         for exclude_pattern in self.exclude_patterns:
@@ -127,25 +128,23 @@ class FalsePositiveFindingsValidator:
 
         return False, None
 
-    def check_rejection_for_finding_value(self, finding: Finding) -> tuple[bool, ExcludePattern | None]:
-        match = finding.match
-        fragment = finding.fragment
-
+    def check_rejection_for_fragment(self, fragment: LineFragment) -> tuple[bool, ExcludePattern | None]:
         if isinstance(fragment, PEMKeyFragment):
             return self.check_rejection_for_pem_key(fragment)
         elif isinstance(fragment, DBConnectionFragment):
-            return self.check_rejection_for_db_conn_string(match)
+            return self.check_rejection_for_db_conn_string(fragment.content)
 
-        return self.check_rejection_for_generic_string(finding)
+        return self.check_rejection_for_generic_string(fragment.content)
 
-    def check_rejection_for_keywords(self, kws: list[str]) -> tuple[bool, str]:
-        exclude = [k.lower() for k in self.exclude_keywords if k]
+    def check_rejection_for_finding_value(self, finding: Finding) -> tuple[bool, ExcludePattern | None]:
+        # findings match their whole candidate, so the fragment decides
+        return self.check_rejection_for_fragment(finding.fragment)
 
+    def check_rejection_for_keywords(self, kws: list[str]) -> tuple[bool, str]:
         for kw in kws:
-            kw_lower = (kw or "").lower()
+            ex = self.exclude_keyword_matcher.first_match((kw or "").lower())
 
-            for ex in exclude:
-                if ex in kw_lower:
-                    return True, ex
+            if ex is not None:
+                return True, ex
 
         return False, ""
@@ -0,0 +1,136 @@
+import re
+
+from bisect import bisect_right
+from typing import Iterable, Iterator
+
+from secrets_hunter.config import PEM_BEGIN_RE
+from secrets_hunter.detection.fragmenter.line_index import LineIndex
+from secrets_hunter.detection.fragmenter.lines_reader import PEMAwareLinesReader
+from secrets_hunter.detection.fragmenter.models import SourceFragment
+from secrets_hunter.detection.stats import DetectionStats
+
+
+class CandidateLinesReader:
+    """
+    Reads a whole text buffer and yields only the lines that contain a
+    candidate, found with one regex pass over the buffer.
+
+    Lines from the first PEM header on are handed to PEMAwareLinesReader,
+    since PEM blocks span lines and may have to be replayed.
+
+    read_ranges reads only the fragments overlapping some line ranges, the same
+    fragments read would yield. Every line holding a PEM header starts a fragment
+    with no PEM block open, so the PEM reader for a range is started at the last
+    PEM header before it instead of at the first one.
+    """
+
+    def __init__(self, candidate_re: re.Pattern, stats: DetectionStats | None = None):
+        self.candidate_re = candidate_re
+        self.stats = stats
+        self.pem_reader = PEMAwareLinesReader()
+
+    def candidate_lines(self, line_index: LineIndex, stop: int, start: int = 0) -> list[int]:
+        if stop <= start:
+            return []
+
+        endpos = line_index.end(stop - 1)
+        lines: list[int] = []
+        last = start - 1
+
+        for match in line_index.regex(self.candidate_re).finditer(line_index.text, line_index.starts[start], endpos):
+            first = line_index.line_at(match.start())
+            end = line_index.line_at(match.end() - 1) if match.end() > match.start() else first
+
+            for i in range(max(first, last + 1), end + 1):
+                lines.append(i)
+
+            last = max(last, end)
+
+        return lines
+
+    def read(self, line_index: LineIndex, line_count: int | None = None) -> Iterator[SourceFragment]:
+        line_count = len(line_index) if line_count is None else line_count
+        text = line_index.text
+        pem_start = line_count
+        pem_re = line_index.regex(PEM_BEGIN_RE)
+        pem_match = pem_re.search(text, 0, line_index.end(line_count - 1)) if line_count else None
+
+        if pem_match:
+            pem_start = line_index.line_at(pem_match.start())
+
+        candidates = self.candidate_lines(line_index, pem_start)
+
+        if self.stats is not None:
+            self.stats.increment("gate_skipped", pem_start - len(candidates))
+
+        for i in candidates:
+            yield SourceFragment(
+                content=line_index.line(i),
+                start_line=i + 1,
+                end_line=i + 1,
+            )
+
+        if pem_start < line_count:
+            yield from self.pem_reader.read(line_index.lines(pem_start, line_count), start=pem_start + 1)
+
+    def read_ranges(self, line_index: LineIndex, ranges: Iterable[tuple[int, int]]) -> Iterator[SourceFragment]:
+        """Fragments overlapping ranges, which are sorted, 1-based, half-open (start, stop) line number pairs."""
+        line_count = len(line_index)
+        pem_re = line_index.regex(PEM_BEGIN_RE)
+        pem_lines = sorted({line_index.line_at(m.start()) for m in pem_re.finditer(line_index.text)})
+        pem_start = pem_lines[0] if pem_lines else line_count
+        pem_ranges: list[tuple[int, int]] = []
+
+        for start, stop in ranges:
+            first, stop = start - 1, min(stop - 1, line_count)
+            plain_stop = min(stop, pem_start)
+            candidates = self.candidate_lines(line_index, plain_stop, first)
+
+            if self.stats is not None and plain_stop > first:
+                self.stats.increment("gate_skipped", plain_stop - first - len(candidates))
+
+            for i in candidates:
+                yield SourceFragment(
+                    content=line_index.line(i),
+                    start_line=i + 1,
+                    end_line=i + 1,
+                )
+
+            if stop > max(first, pem_start):
+                pem_ranges.append((max(first, pem_start), stop))
+
+        if pem_ranges:
+            yield from self._read_pem_ranges(line_index, pem_lines, pem_ranges)
+
+    def _read_pem_ranges(
+        self,
+        line_index: LineIndex,
+        pem_lines: list[int],
+        ranges: list[tuple[int, int]]
+    ) -> Iterator[SourceFragment]:
+        """ranges are 0-based, half-open and start at or after the first PEM header."""
+        fragments: Iterator[SourceFragment] | None = None
+        pending: SourceFragment | None = None
+        read_until = -1
+        last_start = 0
+
+        for first, stop in ranges:
+            reader_start = pem_lines[bisect_right(pem_lines, first) - 1]
+
+            # the running reader already yields the fragments from reader_start on
+            if fragments is None or reader_start > read_until:
+                lines = (line_index.line(i) for i in range(reader_start, len(line_index)))
+                fragments = self.pem_reader.read(lines, start=reader_start + 1)
+                pending = None
+
+            while (fragment := pending or next(fragments, None)) is not None:
+                pending = None
+                read_until = max(read_until, fragment.end_line - 1)
+
+                if fragment.start_line > stop:
+                    pending = fragment
+                    break
+
+                if fragment.end_line > first and fragment.start_line > last_start:
+                    last_start = fragment.start_line
+                    yield fragment
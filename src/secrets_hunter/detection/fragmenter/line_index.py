@@ -0,0 +1,81 @@
+import re
+
+from bisect import bisect_right
+from functools import lru_cache
+
+# Line boundaries of str.splitlines()
+SPLITLINES_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+# Line boundaries of a text-mode file, universal newlines already translated to "\n"
+TEXT_MODE_BREAKS = "\n"
+
+
+@lru_cache(maxsize=None)
+def line_break_regex(breaks: str) -> re.Pattern:
+    char_class = "[" + re.escape(breaks) + "]"
+
+    if "\r" in breaks and "\n" in breaks:
+        return re.compile(r"\r\n|" + char_class)
+
+    return re.compile(char_class)
+
+
+@lru_cache(maxsize=None)
+def bytes_regex(pattern: re.Pattern) -> re.Pattern:
+    """The bytes counterpart of a str regex, matching the same on ASCII input."""
+    return re.compile(pattern.pattern.encode("utf-8"), pattern.flags & ~re.UNICODE)
+
+
+class LineIndex:
+    """
+    Start offsets of the lines of a text buffer, so that offsets of matches
+    found in the whole buffer can be mapped back to line numbers.
+
+    Lines keep their line break, like str.splitlines(keepends=True).
+    """
+
+    def __init__(self, text: str, breaks: str = SPLITLINES_BREAKS):
+        self.text = text
+        self.breaks = breaks
+        self.starts: list[int] = [0]
+        self.starts.extend(m.end() for m in self.regex(line_break_regex(breaks)).finditer(text))
+
+        # a trailing line break does not open another line
+        if self.starts[-1] == len(text):
+            self.starts.pop()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def regex(self, pattern: re.Pattern) -> re.Pattern:
+        """pattern, in the form that searches this buffer."""
+        return pattern
+
+    def end(self, index: int) -> int:
+        return self.starts[index + 1] if index + 1 < len(self.starts) else len(self.text)
+
+    def line_at(self, offset: int) -> int:
+        """0-based index of the line containing offset."""
+        return bisect_right(self.starts, offset) - 1
+
+    def line(self, index: int) -> str:
+        return self.text[self.starts[index]:self.end(index)]
+
+    def lines(self, start: int = 0, stop: int | None = None) -> list[str]:
+        stop = len(self.starts) if stop is None else stop
+        return [self.line(i) for i in range(start, stop)]
+
+
+class ByteLineIndex(LineIndex):
+    """
+    LineIndex over an ASCII bytes-like buffer, such as a memory-mapped file.
+    Regexes are searched in the raw bytes and a line is only decoded when it is read.
+    """
+
+    def __init__(self, data: bytes):
+        super().__init__(data, TEXT_MODE_BREAKS)
+
+    def regex(self, pattern: re.Pattern) -> re.Pattern:
+        return bytes_regex(pattern)
+
+    def line(self, index: int) -> str:
+        return self.text[self.starts[index]:self.end(index)].decode("utf-8", errors="replace")
@@ -0,0 +1,105 @@
+import re
+
+from typing import Iterator
+
+from secrets_hunter.config.settings import FileSettings
+from secrets_hunter.detection.fragmenter.line_index import TEXT_MODE_BREAKS
+from secrets_hunter.detection.fragmenter.models import SourceFragment
+
+
+# A run of one character, matched possessively so it never backtracks
+CHAR_RUN_RE = re.compile(r'(.)\1*+', re.DOTALL)
+
+
+def repeat_runs(content: str, min_run: int | None = None, breaks: str = TEXT_MODE_BREAKS) -> Iterator[tuple[int, int]]:
+    """
+    Start and end offsets of the runs of min_run or more identical characters
+    in content, other than line breaks, in linear time.
+
+    Only every half-run-length-th offset is probed: a run that long always holds
+    the half-run-length stretch after some probe, and only such probes are
+    extended to the whole run.
+    """
+    min_run = FileSettings.MAX_REPEAT_RUN if min_run is None else min_run
+    probe_step = max((min_run + 1) // 2, 1)
+    length = len(content)
+    i = 0
+
+    while i < length:
+        char = content[i]
+
+        if char in breaks or not content.startswith(char * probe_step, i):
+            i += probe_step
+            continue
+
+        before = content[max(i - probe_step + 1, 0):i]
+        start = i - (len(before) - len(before.rstrip(char)))
+        end = CHAR_RUN_RE.match(content, i).end()
+
+        if end - start >= min_run:
+            yield start, end
+
+        i = end
+
+
+class LineWindower:
+    """
+    Splits source fragments holding an over-long line or a long run of one
+    character into overlapping windows, so that minified and generated lines
+    are scanned at a bounded cost instead of ending the scan of their file.
+
+    Runs of MAX_REPEAT_RUN or more identical characters are cut out, as no secret
+    is made of them. What is left is split into windows of at most window_size
+    characters, each overlapping the previous one by `overlap` characters.
+    """
+
+    def __init__(self, window_size: int, overlap: int = FileSettings.LINE_WINDOW_OVERLAP):
+        self.window_size = window_size
+        self.overlap = overlap
+
+    def needs_windows(self, source_fragment: SourceFragment) -> bool:
+        content = source_fragment.content
+
+        if len(content) > self.window_size:
+            if source_fragment.start_line == source_fragment.end_line:
+                return True
+
+            if max(map(len, content.split("\n"))) > self.window_size:
+                return True
+
+        if len(content) < FileSettings.MAX_REPEAT_RUN:
+            return False
+
+        return next(repeat_runs(content), None) is not None
+
+    def windows(self, source_fragment: SourceFragment) -> Iterator[tuple[SourceFragment, tuple[int, int]]]:
+        """
+        Yield every window with the offsets, relative to it, where the matches it
+        reports may start. Windows split their overlaps in half, so a match no
+        longer than half the overlap is reported by the one window that holds it
+        whole, never as a truncated part by its neighbour.
+        """
+        content = source_fragment.content
+        step = self.window_size - self.overlap
+        half = self.overlap // 2
+        start = 0
+
+        for run in (*repeat_runs(content), None):
+            end = len(content) if run is None else run[0]
+
+            for window_start in range(start, end, step):
+                window_end = min(window_start + self.window_size, end)
+                window = SourceFragment(
+                    content=content[window_start:window_end],
+                    start_line=source_fragment.start_line + content.count("\n", 0, window_start),
+                    end_line=source_fragment.start_line + content.count("\n", 0, window_end - 1),
+                )
+                owned_start = half if window_start > start else 0
+                owned_end = step + half if window_end < end else window_end - window_start
+                yield window, (owned_start, owned_end)
+
+                if window_end == end:
+                    break
+
+            if run is not None:
+                start = run[1]
@@ -6,8 +6,8 @@ from secrets_hunter.detection.fragmenter.models import SourceFragment
 
 
 class LinesReader:
-    def read(self, lines: Iterable[str]):
-        for line_num, line in enumerate(lines, 1):
+    def read(self, lines: Iterable[str], start: int = 1):
+        for line_num, line in enumerate(lines, start):
             yield SourceFragment(
                 content=line,
                 start_line=line_num,
@@ -16,8 +16,8 @@ class LinesReader:
 
 
 class PEMAwareLinesReader(LinesReader):
-    def read(self, lines: Iterable[str]):
-        iterator = enumerate(lines, 1)
+    def read(self, lines: Iterable[str], start: int = 1):
+        iterator = enumerate(lines, start)
         pending: deque[tuple[int, str]] = deque()
 
         def next_item() -> tuple[int, str] | None:
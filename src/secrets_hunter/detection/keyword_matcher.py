@@ -0,0 +1,104 @@
+from collections import deque
+from typing import Iterable
+
+from secrets_hunter.config.settings import DetectionSettings
+
+NO_MATCH = -1
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a keyword list.
+
+    Answers which keyword occurs in a string in a single pass over it. When
+    several keywords occur, the one listed first wins, as with a substring
+    loop over the list. Lists shorter than automaton_min_keywords are matched
+    with that loop instead.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        automaton_min_keywords: int = DetectionSettings.KEYWORD_AUTOMATON_MIN_KEYWORDS
+    ):
+        self.keywords: list[str] = list(keywords)
+        self._delta: list[dict[str, int]] | None = None
+
+        if len(self.keywords) < automaton_min_keywords:
+            return
+
+        goto: list[dict[str, int]] = [{}]
+        # lowest keyword index ending at each state
+        best: list[int] = [NO_MATCH]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+
+            for ch in keyword:
+                next_state = goto[state].get(ch)
+
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    best.append(NO_MATCH)
+
+                state = next_state
+
+            if best[state] == NO_MATCH:
+                best[state] = index
+
+        self._delta, self._best = self._build(goto, best)
+
+    @staticmethod
+    def _lower_index(a: int, b: int) -> int:
+        if a == NO_MATCH:
+            return b
+
+        if b == NO_MATCH:
+            return a
+
+        return min(a, b)
+
+    def _build(self, goto: list[dict[str, int]], best: list[int]) -> tuple[list[dict[str, int]], list[int]]:
+        """Resolve failure links into a full transition table (missing chars go back to the root)."""
+        delta: list[dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            fallback = fail[state]
+            best[state] = self._lower_index(best[state], best[fallback])
+
+            # inherit the fallback's transitions, then override with own edges
+            delta[state] = dict(delta[fallback])
+
+            for ch, next_state in goto[state].items():
+                fail[next_state] = delta[fallback].get(ch, 0) if state else 0
+                delta[state][ch] = next_state
+                queue.append(next_state)
+
+        return delta, best
+
+    def first_match(self, text: str) -> str | None:
+        if self._delta is None:
+            return next((keyword for keyword in self.keywords if keyword in text), None)
+
+        delta = self._delta
+        best = self._best
+        state = 0
+        found = best[0]
+
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            index = best[state]
+
+            if index != NO_MATCH and (found == NO_MATCH or index < found):
+                found = index
+
+                if found == 0:
+                    break
+
+        return None if found == NO_MATCH else self.keywords[found]
@@ -0,0 +1,85 @@
+import math
+import re
+
+from secrets_hunter.detection.detectors.entropy_detector import EntropyDetector
+from secrets_hunter.detection.detectors.pattern_detector import PatternDetector
+
+QUOTES = ('"', "'", "`")
+PEM_MARKER = "-----BEGIN "
+URI_MARKER = "://"
+
+
+def min_distinct_chars(threshold: float) -> int:
+    """Smallest number of distinct characters whose max possible entropy reaches threshold."""
+    n = 1
+
+    while math.log2(n) < threshold:
+        n += 1
+
+    return n
+
+
+class LineGate:
+    """
+    Cheap check that rejects source fragments which cannot produce a finding,
+    so they never reach SourceFragmenter.extract.
+
+    Every candidate extracted from a fragment is a substring of it, so a fragment
+    can only produce a finding when it contains:
+
+    - a PEM header or a URI (PEM keys, DB connection strings),
+    - a literal anchor of a secret pattern,
+    - a run of hex or base64 characters long enough to hold as many distinct
+      characters as the entropy thresholds require.
+
+    Secret patterns without anchors can match any candidate, so with such
+    patterns configured any fragment that can yield a candidate is let through.
+    """
+
+    def __init__(self, pattern_detector: PatternDetector, entropy_detector: EntropyDetector, min_token_length: int):
+        self.pattern_detector = pattern_detector
+        self.min_token_length = min_token_length
+
+        cli_args = entropy_detector.cli_args
+        hex_run = min_distinct_chars(cli_args.hex_entropy_threshold)
+        b64_run = min_distinct_chars(cli_args.b64_entropy_threshold)
+        self._entropy_run_re = re.compile(
+            rf'[0-9A-Fa-f]{{{hex_run},}}|[A-Za-z0-9+/=_-]{{{b64_run},}}'
+        )
+        self._chunk_re = re.compile(rf'\S{{{min_token_length},}}')
+
+    def candidate_regex(self) -> re.Pattern:
+        """
+        One regex finding everything that makes a line pass the gate, for scanning
+        a whole buffer at once. PEM headers are left to the caller.
+        """
+        alternatives = [re.escape(URI_MARKER), self._entropy_run_re.pattern]
+        alternatives.extend(re.escape(anchor) for anchor in self.pattern_detector.anchors)
+        alternatives.extend(f"(?i:{re.escape(anchor)})" for anchor in self.pattern_detector.folded_anchors)
+
+        if self.pattern_detector.has_unanchored_patterns:
+            alternatives.append("[" + re.escape("".join(QUOTES)) + "]")
+            alternatives.append(self._chunk_re.pattern)
+
+        return re.compile("|".join(alternatives))
+
+    def allows(self, content: str) -> bool:
+        if PEM_MARKER in content or URI_MARKER in content:
+            return True
+
+        if self.pattern_detector.contains_anchor(content):
+            return True
+
+        if self._entropy_run_re.search(content):
+            return True
+
+        if self.pattern_detector.has_unanchored_patterns:
+            return self._may_yield_candidate(content)
+
+        return False
+
+    def _may_yield_candidate(self, content: str) -> bool:
+        if any(quote in content for quote in QUOTES):
+            return True
+
+        return bool(self._chunk_re.search(content))
@@ -34,3 +34,11 @@ def _build_bigram_model() -> dict[tuple[str, str], float]:
 
 
 BIGRAM_MODEL: dict[tuple[str, str], float] = _build_bigram_model()
+
+
+def _build_bigram_table() -> list[float]:
+    """Return BIGRAM_MODEL flattened to a 26x26 table indexed by (ord(a) - 97) * 26 + ord(b) - 97."""
+    return [BIGRAM_MODEL[(a, b)] for a in string.ascii_lowercase for b in string.ascii_lowercase]
+
+
+BIGRAM_TABLE: list[float] = _build_bigram_table()
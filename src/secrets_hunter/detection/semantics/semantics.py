@@ -1,10 +1,21 @@
 import re
 
-from .bigrams import BIGRAM_MODEL
-from .corpus import CORPUS
+from functools import lru_cache
+from typing import Iterable
+
+from .bigrams import BIGRAM_MODEL, BIGRAM_TABLE
+from .corpus import load_corpus
 
 from .models import StringSemanticsClassification, StringKind
 
+_SEPARATORS_RE = re.compile(r"[_\-./\s]+")
+_ACRONYM_BOUNDARY_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z\d])([A-Z])")
+_NON_LOWER_RE = re.compile(r"[^a-z]")
+
+# Offset of a bigram's BIGRAM_TABLE index from ord(a) * 26 + ord(b)
+_BIGRAM_INDEX_OFFSET = ord("a") * 26 + ord("a")
+
 
 class StringSemanticsClassifier:
     """
@@ -22,59 +33,72 @@ class StringSemanticsClassifier:
         word_weight:   float = 0.6,
         bigram_weight: float = 0.4,
         threshold:     float = 0.43,
+        cache_size:    int = 16384,
     ) -> None:
         self.word_weight   = word_weight
         self.bigram_weight = bigram_weight
         self.threshold     = threshold
+        self._classify_cached = lru_cache(maxsize=cache_size)(self._classify)
 
     @staticmethod
     def split_tokens(s: str) -> list[str]:
-        parts = re.split(r"[_\-./\s]+", s)
         tokens: list[str] = []
 
-        for part in parts:
+        for part in _SEPARATORS_RE.split(s):
             if not part:
                 continue
 
-            p = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", part)
-            p = re.sub(r"([a-z\d])([A-Z])", r"\1 \2", p)
+            p = _ACRONYM_BOUNDARY_RE.sub(r"\1 \2", part)
+            p = _CAMEL_BOUNDARY_RE.sub(r"\1 \2", p)
 
-            tokens.extend(t for t in p.split() if t)
+            tokens.extend(p.split())
 
         return tokens
 
     @staticmethod
-    def word_match_ratio(s: str) -> float:
-        tokens = StringSemanticsClassifier.split_tokens(s)
-
+    def tokens_match_ratio(tokens: list[str]) -> float:
         if not tokens:
             return 0.0
 
-        return sum(1 for t in tokens if t.lower() in CORPUS) / len(tokens)
+        corpus = load_corpus()
+        return sum(1 for t in tokens if t.lower() in corpus) / len(tokens)
+
+    @staticmethod
+    def word_match_ratio(s: str) -> float:
+        return StringSemanticsClassifier.tokens_match_ratio(StringSemanticsClassifier.split_tokens(s))
 
     @classmethod
     def bigram_score(cls, s: str) -> float:
-        cleaned = re.sub(r"[^a-z]", "", s.lower())
+        cleaned = _NON_LOWER_RE.sub("", s.lower()).encode("ascii")
 
         if len(cleaned) < 2:
             return 0.0
 
-        pairs = [(cleaned[i], cleaned[i + 1]) for i in range(len(cleaned) - 1)]
-        avg_log_prob = sum(BIGRAM_MODEL[pair] for pair in pairs) / len(pairs)
+        offset = _BIGRAM_INDEX_OFFSET
+        log_prob = sum(BIGRAM_TABLE[a * 26 + b - offset] for a, b in zip(cleaned, cleaned[1:]))
+        avg_log_prob = log_prob / (len(cleaned) - 1)
         score = (avg_log_prob - cls._RANDOM_BASELINE) / (cls._BEST_BASELINE - cls._RANDOM_BASELINE)
 
         return max(0.0, min(1.0, score))
 
-    def classify(self, s: str) -> StringSemanticsClassification:
-        wmr = self.word_match_ratio(s)
+    def _classify(self, s: str) -> StringSemanticsClassification:
+        tokens = self.split_tokens(s)
+        wmr = self.tokens_match_ratio(tokens)
         bgs = self.bigram_score(s)
         combined = self.word_weight * wmr + self.bigram_weight * bgs
 
         return StringSemanticsClassification(
             string=s,
-            tokens=self.split_tokens(s),
+            tokens=tokens,
             word_match_ratio=round(wmr, 3),
             bigram_score=round(bgs, 3),
             combined_score=round(combined, 3),
             kind=StringKind.STRUCTURED if combined >= self.threshold else StringKind.RANDOM
         )
+
+    def classify(self, s: str) -> StringSemanticsClassification:
+        # results are cached and shared, so their tokens must not be mutated
+        return self._classify_cached(s)
+
+    def classify_many(self, strings: Iterable[str]) -> list[StringSemanticsClassification]:
+        return [self._classify_cached(s) for s in strings]
@@ -0,0 +1,33 @@
+from collections import Counter
+from threading import Lock
+
+
+class DetectionStats:
+    """Named counters shared by the workers of a scan."""
+
+    def __init__(self):
+        self._counts: Counter[str] = Counter()
+        self._lock = Lock()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def merge(self, counts: dict[str, int]) -> None:
+        with self._lock:
+            self._counts.update(counts)
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counts[name]
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def drain(self) -> dict[str, int]:
+        """Return the counts and reset them, for shipping a worker's counts to the parent."""
+        with self._lock:
+            counts = dict(self._counts)
+            self._counts.clear()
+            return counts
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Hashable
+
+from secrets_hunter.models.config import ExcludePattern
+
+
+@dataclass(frozen=True)
+class CandidateVerdict:
+    # Detector results for one candidate, independent of where it was found.
+    entropy_type: str | None
+    pattern_types: tuple[str, ...]
+    rejected: bool = False
+    rejected_by: ExcludePattern | None = None
+
+    @property
+    def has_findings(self) -> bool:
+        return self.entropy_type is not None or bool(self.pattern_types)
+
+
+class VerdictCache:
+    """Bounded LRU of candidate verdicts, shared by the workers of a scan."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, CandidateVerdict] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> CandidateVerdict | None:
+        with self._lock:
+            verdict = self._entries.get(key)
+
+            if verdict is not None:
+                self._entries.move_to_end(key)
+
+            return verdict
+
+    def put(self, key: Hashable, verdict: CandidateVerdict) -> None:
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
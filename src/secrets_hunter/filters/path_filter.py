@@ -20,3 +20,7 @@ class PathFilter:
             return True
 
         return any(part in self.ignore_dirs for part in path.parts[:-1])
+
+    def is_ignored_dir(self, path: Path) -> bool:
+        """Whether a directory, and so everything below it, is ignored."""
+        return path.name in self.ignore_dirs or self.is_ignored_path(path)
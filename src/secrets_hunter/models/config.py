@@ -1,6 +1,6 @@
 import re
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -20,3 +20,5 @@ class RuntimeConfig:
     ignore_files:        tuple[str, ...]
     ignore_extensions:   tuple[str, ...]
     ignore_dirs:         tuple[str, ...]
+    # secret pattern name -> literals of which at least one must occur for a match
+    secret_pattern_anchors: dict[str, tuple[str, ...]] = field(default_factory=dict)
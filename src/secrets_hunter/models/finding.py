@@ -72,6 +72,15 @@ class Finding:
     def with_match(self, match: str) -> 'Finding':
         return replace(self, match=match)
 
+    def with_file(self, file: str) -> 'Finding':
+        title = self.title
+        location = f" at {self.file}:{self.line}"
+
+        if title.endswith(location):
+            title = title[:-len(location)] + f" at {file}:{self.line}"
+
+        return replace(self, file=file, title=title)
+
     def with_commit(self, commit: str) -> 'Finding':
         return replace(self, commit=commit)
 
@@ -8,3 +8,7 @@ from .finding import Finding
 class ScanWorkItem:
     label: str
     run: Callable[[], tuple[list[Finding], bool]]
+    # Picklable description of the work, run by WorkerProcessScanner.scan_task in worker processes
+    task: object | None = None
+    # Approximate number of bytes to scan, used to size batches
+    size: int = 0
@@ -1,3 +1,3 @@
-from .scanner import BaseScanner
+from .scanner import BaseScanner, WorkerProcessScanner
 
-__all__ = ["BaseScanner"]
+__all__ = ["BaseScanner", "WorkerProcessScanner"]
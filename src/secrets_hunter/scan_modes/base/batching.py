@@ -0,0 +1,148 @@
+from concurrent.futures import Future
+from dataclasses import dataclass
+from queue import SimpleQueue
+from threading import BoundedSemaphore, Lock, Thread
+from typing import Callable, Iterable, Iterator
+
+from secrets_hunter.config.settings import BatchSettings
+from secrets_hunter.models import Finding, ScanWorkItem
+
+
+@dataclass(frozen=True)
+class ItemResult:
+    # Outcome of one work item of a batch.
+    findings: list[Finding]
+    success: bool
+    error: BaseException | None = None
+
+
+def batch_budget(items: list[ScanWorkItem], max_workers: int) -> int:
+    total = sum(item.size + BatchSettings.ITEM_OVERHEAD_BYTES for item in items)
+    min_batches = max(max_workers, 1) * BatchSettings.MIN_BATCHES_PER_WORKER
+    return max(min(BatchSettings.BATCH_BYTES, total // min_batches), 1)
+
+
+def stream_batches(
+    items: Iterable[ScanWorkItem],
+    budget: int,
+    workers_idle: Callable[[], bool] = lambda: False
+) -> Iterator[list[ScanWorkItem]]:
+    """
+    Group work items into batches of about budget bytes, so tiny files share
+    one future while large ones get their own. A batch is closed early while
+    workers are idle, so nobody waits for a batch to fill up.
+    """
+    batch: list[ScanWorkItem] = []
+    batch_bytes = 0
+
+    for item in items:
+        batch.append(item)
+        batch_bytes += item.size + BatchSettings.ITEM_OVERHEAD_BYTES
+
+        if batch_bytes >= budget or workers_idle():
+            yield batch
+            batch, batch_bytes = [], 0
+
+    if batch:
+        yield batch
+
+
+def plan_batches(items: list[ScanWorkItem], max_workers: int) -> list[list[ScanWorkItem]]:
+    return list(stream_batches(items, batch_budget(items, max_workers)))
+
+
+class BatchPipeline:
+    """
+    Submits batches from a producer thread and hands them back as they complete.
+
+    The producer also drives work item discovery, and stops pulling new items
+    while max_workers * MAX_IN_FLIGHT_PER_WORKER batches are pending, so memory
+    stays flat however many items are discovered.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.discovered = 0
+        self.discovering = True
+        self._pending = 0
+        self._pending_lock = Lock()
+        self._slots = BoundedSemaphore(max(max_workers, 1) * BatchSettings.MAX_IN_FLIGHT_PER_WORKER)
+
+    @property
+    def total(self) -> int | None:
+        """Number of work items, once discovery has finished."""
+        return None if self.discovering else self.discovered
+
+    def has_idle_workers(self) -> bool:
+        return self._pending < self.max_workers
+
+    def _add_pending(self, amount: int) -> None:
+        with self._pending_lock:
+            self._pending += amount
+
+    def discover(self, items: Iterable[ScanWorkItem]) -> Iterator[ScanWorkItem]:
+        for item in items:
+            self.discovered += 1
+            yield item
+
+        self.discovering = False
+
+    def run(
+        self,
+        batches: Iterable[list[ScanWorkItem]],
+        submit: Callable[[list[ScanWorkItem]], Future],
+        collect: Callable[[Future], list[ItemResult]]
+    ) -> Iterator[tuple[list[ScanWorkItem], list[ItemResult]]]:
+        completed: SimpleQueue = SimpleQueue()
+        producer_errors: list[BaseException] = []
+
+        def produce() -> None:
+            try:
+                for batch in batches:
+                    self._slots.acquire()
+                    future = submit(batch)
+                    self._add_pending(1)
+                    future.add_done_callback(lambda f, batch=batch: completed.put((batch, f)))
+            except BaseException as e:
+                producer_errors.append(e)
+            finally:
+                self.discovering = False
+                completed.put(None)
+
+        producer = Thread(target=produce, name="work-item-producer", daemon=True)
+        producer.start()
+        producing = True
+
+        while producing or self._pending:
+            entry = completed.get()
+
+            if entry is None:
+                producing = False
+                continue
+
+            batch, future = entry
+
+            try:
+                results = collect(future)
+            except Exception as e:
+                results = [ItemResult([], False, e)] * len(batch)
+
+            self._add_pending(-1)
+            self._slots.release()
+            yield batch, results
+
+        if producer_errors:
+            raise producer_errors[0]
+
+
+def run_batch(items: list[ScanWorkItem]) -> list[ItemResult]:
+    results: list[ItemResult] = []
+
+    for item in items:
+        try:
+            findings, success = item.run()
+            results.append(ItemResult(findings, success))
+        except Exception as e:
+            results.append(ItemResult([], False, e))
+
+    return results
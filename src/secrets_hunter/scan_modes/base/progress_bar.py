@@ -7,7 +7,13 @@ class FolderProgressBar:
         self.bar_width = bar_width
         self.last_percent = -1
 
-    def render(self, done: int, total_files: int):
+    def render(self, done: int, total_files: int | None, discovered: int | None = None):
+        if total_files is None:
+            # still discovering files, so there is no ratio yet
+            sys.stdout.write(f"\rScanned {done} of {discovered or done} found so far...")
+            sys.stdout.flush()
+            return
+
         ratio = done / total_files
         filled = math.floor(self.bar_width * ratio)
         bar = "█" * filled + "-" * (self.bar_width - filled)
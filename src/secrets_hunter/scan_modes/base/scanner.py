@@ -1,24 +1,32 @@
 import logging
 
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from secrets_hunter.config import CLIArgs
+from secrets_hunter.config.settings import BatchSettings
+from secrets_hunter.detection.detectors.combined_pattern_detector import CombinedPatternDetector
 from secrets_hunter.detection.detectors.entropy_detector import EntropyDetector
 from secrets_hunter.detection.detectors.pattern_detector import PatternDetector
 from secrets_hunter.detection.engine import DetectionEngine
 from secrets_hunter.detection.false_positive_validator import FalsePositiveFindingsValidator
+from secrets_hunter.detection.fragmenter.buffer_reader import CandidateLinesReader
 from secrets_hunter.detection.fragmenter.fragmenter import SourceFragmenter
+from secrets_hunter.detection.fragmenter.line_windows import LineWindower
+from secrets_hunter.detection.fragmenter.line_index import ByteLineIndex, LineIndex, SPLITLINES_BREAKS
 from secrets_hunter.detection.fragmenter.lines_reader import PEMAwareLinesReader
+from secrets_hunter.detection.fragmenter.models import SourceFragment
+from secrets_hunter.detection.line_gate import LineGate
 from secrets_hunter.filters import PathFilter
 from secrets_hunter.models import Finding, ScanWorkItem
 from secrets_hunter.models.config import RuntimeConfig
 from secrets_hunter.scan_modes.base.progress_bar import FileProgressBar, FolderProgressBar
 from secrets_hunter.scan_modes.base.reader import SourceTextReader
+from secrets_hunter.scan_modes.base.batching import BatchPipeline, ItemResult, batch_budget, run_batch, stream_batches
+from secrets_hunter.scan_modes.base.worker import ScannerSpec, init_worker, run_tasks, unpack_findings
 from secrets_hunter.detection.semantics import StringSemanticsClassifier
-from secrets_hunter.validators import TextContentValidator
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +35,22 @@ class BaseScanner(ABC):
     def __init__(self, runtime_cfg: RuntimeConfig, cli_args: CLIArgs | None = None):
         self.cli_args = cli_args or CLIArgs()
         self.runtime_cfg = runtime_cfg
+        self.base_path: str | None = None
         self.path_filter = PathFilter(
             set(self.runtime_cfg.ignore_files),
             set(self.runtime_cfg.ignore_extensions),
             set(self.runtime_cfg.ignore_dirs)
         )
-        self.pattern_detector = PatternDetector(self.runtime_cfg.secret_patterns)
+        pattern_detector_cls = (
+            CombinedPatternDetector if self.cli_args.pattern_engine == "combined" else PatternDetector
+        )
+        self.pattern_detector = pattern_detector_cls(
+            self.runtime_cfg.secret_patterns,
+            self.runtime_cfg.secret_pattern_anchors
+        )
         self.entropy_detector = EntropyDetector(self.cli_args)
         self.lines_reader = PEMAwareLinesReader()
         self.source_text_reader = SourceTextReader()
-        self.text_content_validator = TextContentValidator()
         self.false_positive_validator = FalsePositiveFindingsValidator(
             exclude_patterns=self.runtime_cfg.exclude_patterns,
             exclude_keywords=self.runtime_cfg.exclude_keywords,
@@ -47,13 +61,21 @@ class BaseScanner(ABC):
             min_token_length=self.cli_args.min_string_length,
             entropy_detector=self.entropy_detector
         )
+        line_gate = LineGate(
+            pattern_detector=self.pattern_detector,
+            entropy_detector=self.entropy_detector,
+            min_token_length=self.cli_args.min_string_length
+        )
         self.detection_engine = DetectionEngine(
             runtime_cfg=self.runtime_cfg,
             pattern_detector=self.pattern_detector,
             entropy_detector=self.entropy_detector,
             source_fragmenter=self.source_fragmenter,
-            false_positive_validator=self.false_positive_validator
+            false_positive_validator=self.false_positive_validator,
+            line_gate=line_gate,
+            line_windower=LineWindower(self.cli_args.line_window_size)
         )
+        self.buffer_reader = CandidateLinesReader(line_gate.candidate_regex(), self.detection_engine.stats)
 
     @abstractmethod
     def collect_work_items(self) -> list[ScanWorkItem]:
@@ -84,27 +106,66 @@ class BaseScanner(ABC):
     def should_scan_directly(self, items: list[ScanWorkItem]) -> bool:
         return False
 
+    def item_failed(self, item: ScanWorkItem) -> None:
+        """Called by scan_work_items for every work item that could not be scanned."""
+
     def set_base_path(self, target: str) -> None:
+        self.base_path = target
         self.pattern_detector.set_base_path(target)
         self.entropy_detector.set_base_path(target)
 
+    @property
+    def supports_worker_processes(self) -> bool:
+        """Whether work items carry tasks that a worker process can run, see WorkerProcessScanner."""
+        return False
+
+    def uses_worker_processes(self) -> bool:
+        if self.cli_args.executor != "process":
+            return False
+
+        if not self.supports_worker_processes:
+            logger.warning(f"Worker processes are not supported for {self.failed_unit_label} scans, using threads")
+            return False
+
+        return True
+
+    def stream_work_items(self) -> Iterator[ScanWorkItem] | None:
+        """Work items yielded while they are discovered, or None to collect them all first."""
+        return None
+
     def scan(self) -> tuple[list[Finding], bool]:
         try:
             if not self.is_valid_target():
                 return [], False
 
+            stream = self.stream_work_items()
+
+            if stream is not None:
+                result = self.scan_work_items(
+                    items=stream,
+                    found_message=None,
+                    empty_message=self.empty_message,
+                    finished_message=self.finished_message,
+                    failed_unit_label=self.failed_unit_label
+                )
+                self.log_detection_stats()
+                return result
+
             items = self.collect_work_items()
 
             if self.should_scan_directly(items):
-                return items[0].run()
-
-            return self.scan_work_items(
-                items=items,
-                found_message=self.found_message(len(items)),
-                empty_message=self.empty_message,
-                finished_message=self.finished_message,
-                failed_unit_label=self.failed_unit_label
-            )
+                result = items[0].run()
+            else:
+                result = self.scan_work_items(
+                    items=items,
+                    found_message=self.found_message(len(items)),
+                    empty_message=self.empty_message,
+                    finished_message=self.finished_message,
+                    failed_unit_label=self.failed_unit_label
+                )
+
+            self.log_detection_stats()
+            return result
         except KeyboardInterrupt:
             print("\n")
             logger.info("Scan aborted.")
@@ -114,11 +175,88 @@ class BaseScanner(ABC):
             logger.debug("Scan work item collection traceback", exc_info=True)
             return [], False
 
+    def log_detection_stats(self) -> None:
+        stats = self.detection_engine.stats
+        skipped = stats.get("gate_skipped")
+        total = skipped + stats.get("gate_passed")
+
+        if total:
+            logger.debug(f"Line gate skipped {skipped} of {total} line(s) before fragmentation")
+
+        windowed = stats.get("windowed_lines")
+
+        if windowed:
+            logger.info(f"Scanned {windowed} long or repetitive line(s) in windows")
+
+        hits = stats.get("verdict_cache_hits")
+        lookups = hits + stats.get("verdict_cache_misses")
+
+        if lookups:
+            logger.debug(f"Verdict cache answered {hits} of {lookups} candidate lookup(s)")
+
+    @property
+    def scans_buffers(self) -> bool:
+        return self.cli_args.scan_engine == "buffer"
+
+    def scan_bytes(self, content: bytes, display_path: Path | str) -> tuple[list[Finding], bool]:
+        if self.scans_buffers:
+            return self.scan_text(self.source_text_reader.decode(content), display_path)
+
+        return self.scan_lines(self.source_text_reader.bytes_to_lines(content), display_path)
+
     def scan_lines(
         self,
         lines: Iterable[str],
         display_path: Path | str,
         show_progress: bool = False
+    ) -> tuple[list[Finding], bool]:
+        fragments = None if lines is None else self.lines_reader.read(lines)
+        return self.scan_source_fragments(fragments, display_path, show_progress)
+
+    def scan_text(
+        self,
+        text: str,
+        display_path: Path | str,
+        show_progress: bool = False,
+        breaks: str = SPLITLINES_BREAKS
+    ) -> tuple[list[Finding], bool]:
+        """Scan a whole buffer at once, only materializing the lines that hold a candidate."""
+        fragments = None if text is None else self._buffer_fragments(text, breaks)
+        return self.scan_source_fragments(fragments, display_path, show_progress)
+
+    def scan_mapped(
+        self,
+        data: bytes,
+        display_path: Path | str,
+        show_progress: bool = False
+    ) -> tuple[list[Finding], bool]:
+        """Scan an ASCII bytes-like buffer, such as a mapped file, decoding only the lines that hold a candidate."""
+        return self.scan_source_fragments(self._mapped_fragments(data), display_path, show_progress)
+
+    def scan_line_ranges(
+        self,
+        content: bytes,
+        display_path: Path | str,
+        ranges: Iterable[tuple[int, int]]
+    ) -> tuple[list[Finding], bool]:
+        """Scan only the fragments of content that overlap the 1-based, half-open line ranges."""
+        line_index = LineIndex(self.source_text_reader.decode(content))
+        return self.scan_source_fragments(self.buffer_reader.read_ranges(line_index, ranges), display_path)
+
+    def _buffer_fragments(self, text: str, breaks: str) -> Iterator[SourceFragment]:
+        yield from self._indexed_fragments(LineIndex(text, breaks))
+
+    def _mapped_fragments(self, data: bytes) -> Iterator[SourceFragment]:
+        yield from self._indexed_fragments(ByteLineIndex(data))
+
+    def _indexed_fragments(self, line_index: LineIndex) -> Iterator[SourceFragment]:
+        return self.buffer_reader.read(line_index)
+
+    def scan_source_fragments(
+        self,
+        fragments: Iterable[SourceFragment] | None,
+        display_path: Path | str,
+        show_progress: bool = False
     ) -> tuple[list[Finding], bool]:
         findings, success = [], False
         progress_bar = None
@@ -129,10 +267,10 @@ class BaseScanner(ABC):
             progress_bar = FileProgressBar()
 
         try:
-            if lines is None:
+            if fragments is None:
                 logger.error(f"Failed to read source: {display_path}")
             else:
-                for source_fragment in self.lines_reader.read(lines):
+                for source_fragment in fragments:
                     fragment_findings = self.detection_engine.scan_fragment(source_fragment, display_path)
                     findings.extend(fragment_findings)
                     last_line_number = source_fragment.end_line
@@ -159,54 +297,76 @@ class BaseScanner(ABC):
 
     def scan_work_items(
         self,
-        items: list[ScanWorkItem],
-        found_message: str,
+        items: Iterable[ScanWorkItem],
+        found_message: str | None,
         empty_message: str,
         finished_message: str,
         failed_unit_label: str
     ) -> tuple[list[Finding], bool]:
+        """
+        Scan work items in batches on a worker pool. items is either a list, or
+        an iterator consumed while it is still discovering them (total unknown).
+        """
         all_findings: list[Finding] = []
-        total_items = len(items)
+        total_items = len(items) if isinstance(items, list) else None
 
-        if not items:
+        if total_items == 0:
             logger.warning(empty_message)
             return all_findings, True
 
-        logger.info(found_message)
-        logger.info(f"Scanning with {self.cli_args.max_workers} workers...\n")
+        use_processes = self.uses_worker_processes()
+        worker_kind = "worker processes" if use_processes else "workers"
+
+        if found_message is not None:
+            logger.info(found_message)
+
+        logger.info(f"Scanning with {self.cli_args.max_workers} {worker_kind}...\n")
 
+        pipeline = BatchPipeline(self.cli_args.max_workers)
         processed_count = 0
         failed_count = 0
         progress_bar = FolderProgressBar()
 
         try:
-            with ThreadPoolExecutor(max_workers=self.cli_args.max_workers) as executor:
-                futures = {executor.submit(item.run): item for item in items}
-
-                for future in as_completed(futures):
-                    item = futures[future]
-
-                    try:
-                        item_findings, item_success = future.result()
-
-                        if not item_success:
+            with self._create_executor(use_processes) as executor:
+                if total_items is None:
+                    budget = BatchSettings.BATCH_BYTES
+                else:
+                    budget = batch_budget(items, self.cli_args.max_workers)
+
+                batches = stream_batches(pipeline.discover(items), budget, pipeline.has_idle_workers)
+
+                completed = pipeline.run(
+                    batches,
+                    submit=lambda batch: self._submit(executor, batch, use_processes),
+                    collect=lambda future: self._batch_results(future, use_processes)
+                )
+
+                for batch, results in completed:
+                    for item, result in zip(batch, results):
+                        if result.error is not None or not result.success:
+                            self.item_failed(item)
+
+                        if result.error is not None:
+                            failed_count += 1
+                            print("\n")
+                            logger.error(
+                                f"Error scanning {failed_unit_label} {item.label}: {result.error}, skipping...",
+                                exc_info=result.error
+                            )
+                        elif not result.success:
                             failed_count += 1
                             print("\n")
                             logger.error(f"Error scanning {failed_unit_label} {item.label}, skipping...")
-                            continue
-
-                        all_findings.extend(item_findings)
-                    except Exception as e:
-                        failed_count += 1
-                        print("\n")
-                        logger.error(
-                            f"Error scanning {failed_unit_label} {item.label}: {e}, skipping...",
-                            exc_info=True
-                        )
-                        continue
-                    finally:
-                        processed_count += 1
-                        progress_bar.render(processed_count, total_items)
+                        else:
+                            all_findings.extend(result.findings)
+
+                    processed_count += len(batch)
+                    progress_bar.render(processed_count, pipeline.total, pipeline.discovered)
+
+            if not processed_count:
+                logger.warning(empty_message)
+                return all_findings, True
 
             print("\n")
 
@@ -221,3 +381,70 @@ class BaseScanner(ABC):
             return all_findings, False
 
         return all_findings, True
+
+    def _create_executor(self, use_processes: bool) -> Executor:
+        if use_processes:
+            # each worker process builds its own scanner, and so its detection engine, once
+            return ProcessPoolExecutor(
+                max_workers=self.cli_args.max_workers,
+                initializer=init_worker,
+                initargs=(self.worker_spec(),)
+            )
+
+        return ThreadPoolExecutor(max_workers=self.cli_args.max_workers)
+
+    @staticmethod
+    def _submit(executor: Executor, batch: list[ScanWorkItem], use_processes: bool) -> Future:
+        if use_processes:
+            return executor.submit(run_tasks, [item.task for item in batch])
+
+        return executor.submit(run_batch, batch)
+
+    def _batch_results(self, future: Future, use_processes: bool) -> list[ItemResult]:
+        if not use_processes:
+            return future.result()
+
+        packed_results, counts = future.result()
+        self.detection_engine.stats.merge(counts)
+        return [ItemResult(unpack_findings(rows), success, error) for rows, success, error in packed_results]
+
+
+class WorkerProcessScanner(BaseScanner):
+    """A scanner whose work items carry picklable tasks, so they can run in worker processes."""
+
+    @property
+    def supports_worker_processes(self) -> bool:
+        return True
+
+    def worker_kwargs(self) -> dict:
+        """Constructor arguments, besides the configs, that rebuild this scanner in a worker process."""
+        return {}
+
+    @abstractmethod
+    def scan_task(self, task: object) -> tuple[list[Finding], bool]:
+        """Run the picklable task of a work item; used by worker processes."""
+
+    def close(self) -> None:
+        """Release what scan_task keeps open between tasks; called when a worker process exits."""
+
+    def rescan_task(self, task: object, label: str) -> tuple[list[Finding], bool]:
+        """Scan task on the calling thread, logging a failure like scan_work_items does."""
+        try:
+            findings, success = self.scan_task(task)
+        except Exception as e:
+            logger.error(f"Error scanning {self.failed_unit_label} {label}: {e}, skipping...", exc_info=e)
+            return [], False
+
+        if not success:
+            logger.error(f"Error scanning {self.failed_unit_label} {label}, skipping...")
+
+        return findings, success
+
+    def worker_spec(self) -> ScannerSpec:
+        return ScannerSpec(
+            scanner_cls=type(self),
+            runtime_cfg=self.runtime_cfg,
+            cli_args=self.cli_args,
+            kwargs=self.worker_kwargs(),
+            base_path=self.base_path
+        )
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field, fields
+from multiprocessing.util import Finalize
+from typing import TYPE_CHECKING
+
+from secrets_hunter.config import CLIArgs
+from secrets_hunter.models import Finding
+from secrets_hunter.models.config import RuntimeConfig
+
+if TYPE_CHECKING:
+    from secrets_hunter.scan_modes.base.scanner import WorkerProcessScanner
+
+FINDING_FIELDS = tuple(f.name for f in fields(Finding))
+
+# Scanner of the current worker process, built once by init_worker
+_scanner: "WorkerProcessScanner | None" = None
+
+
+@dataclass(frozen=True)
+class ScannerSpec:
+    # Everything a worker process needs to rebuild the parent's scanner.
+    scanner_cls: type
+    runtime_cfg: RuntimeConfig
+    cli_args: CLIArgs
+    kwargs: dict = field(default_factory=dict)
+    base_path: str | None = None
+
+    def build(self) -> "WorkerProcessScanner":
+        scanner = self.scanner_cls(self.runtime_cfg, self.cli_args, **self.kwargs)
+
+        if self.base_path is not None:
+            scanner.set_base_path(self.base_path)
+
+        return scanner
+
+
+def pack_findings(findings: list[Finding]) -> list[tuple]:
+    return [tuple(getattr(finding, name) for name in FINDING_FIELDS) for finding in findings]
+
+
+def unpack_findings(rows: list[tuple]) -> list[Finding]:
+    return [Finding(*row) for row in rows]
+
+
+def init_worker(spec: ScannerSpec) -> None:
+    global _scanner
+    _scanner = spec.build()
+    # pool workers leave through os._exit, which skips atexit but runs multiprocessing finalizers
+    Finalize(_scanner, _scanner.close, exitpriority=10)
+
+
+def run_tasks(tasks: list[object]) -> tuple[list[tuple[list[tuple], bool, Exception | None]], dict[str, int]]:
+    """
+    Scan a batch of work item tasks; returns packed findings, success and error
+    of every task, plus the detection stats the batch produced.
+    """
+    results = []
+
+    for task in tasks:
+        try:
+            findings, success = _scanner.scan_task(task)
+            results.append((pack_findings(findings), success, None))
+        except Exception as e:
+            # the exception type may not survive pickling, its message does
+            results.append(([], False, RuntimeError(str(e))))
+
+    return results, _scanner.detection_engine.stats.drain()
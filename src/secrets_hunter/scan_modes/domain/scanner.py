@@ -65,10 +65,7 @@ class DomainScanner(BaseScanner):
         if not TextContentValidator.is_text_content(response_body):
             return [], True
 
-        findings, scan_success = self.scan_lines(
-            self.source_text_reader.bytes_to_lines(response_body),
-            domain_client.display_path(url),
-        )
+        findings, scan_success = self.scan_bytes(response_body, domain_client.display_path(url))
 
         if not scan_success:
             return findings, scan_success
@@ -0,0 +1,69 @@
+import hashlib
+import os
+
+from collections import defaultdict
+from pathlib import Path
+
+from secrets_hunter.config.settings import FileSettings
+
+
+class DuplicateFiles:
+    """
+    Recognizes files whose content was already seen during a scan, so that
+    identical files are scanned once.
+
+    Hardlinks are matched by inode without reading them. Other files are only
+    hashed once a second file of the same size shows up; the first file of
+    that size is hashed at that point. Files smaller than min_size are only
+    matched by inode.
+    """
+
+    def __init__(self, min_size: int = FileSettings.DEDUP_MIN_FILE_SIZE):
+        self.min_size = min_size
+        self.copies: dict[Path, list[Path]] = defaultdict(list)
+        self._by_inode: dict[tuple[int, int], Path] = {}
+        # first file seen of each size, until another file of that size forces hashing it
+        self._unhashed_by_size: dict[int, Path] = {}
+        self._hashed_sizes: set[int] = set()
+        self._by_digest: dict[tuple[int, bytes], Path] = {}
+
+    @property
+    def copy_count(self) -> int:
+        return sum(map(len, self.copies.values()))
+
+    def original_of(self, path: Path, stat: os.stat_result) -> Path | None:
+        """Record path and return the earlier file it is a copy of, or None when its content is new."""
+        inode = (stat.st_dev, stat.st_ino)
+        original = self._by_inode.setdefault(inode, path)
+
+        if original == path:
+            original = self._original_by_content(path, stat.st_size) if stat.st_size >= self.min_size else None
+
+        if original is not None:
+            self.copies[original].append(path)
+
+        return original
+
+    def _original_by_content(self, path: Path, size: int) -> Path | None:
+        if size not in self._hashed_sizes:
+            first = self._unhashed_by_size.setdefault(size, path)
+
+            if first == path:
+                return None
+
+            del self._unhashed_by_size[size]
+            self._hashed_sizes.add(size)
+            self._remember(first, size)
+
+        return self._remember(path, size)
+
+    def _remember(self, path: Path, size: int) -> Path | None:
+        """Hash path and return the earlier file with that digest, recording path if there is none."""
+        try:
+            with open(path, 'rb') as f:
+                digest = hashlib.file_digest(f, "blake2b").digest()
+        except OSError:
+            return None
+
+        original = self._by_digest.setdefault((size, digest), path)
+        return None if original == path else original
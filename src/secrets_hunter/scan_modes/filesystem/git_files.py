@@ -0,0 +1,53 @@
+import logging
+import os
+import subprocess
+
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class GitFileLister:
+    """Lists the files below a directory that git does not ignore."""
+
+    @staticmethod
+    def is_work_tree(directory: Path) -> bool:
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--is-inside-work-tree"],
+                cwd=directory,
+                capture_output=True,
+                check=False
+            )
+        except OSError:
+            return False
+
+        return result.returncode == 0 and result.stdout.strip() == b"true"
+
+    @staticmethod
+    def iter_files(directory: Path) -> Iterator[Path]:
+        """
+        Yield tracked files and untracked files that are not excluded by .gitignore,
+        .git/info/exclude or the global excludes file, streamed from one git ls-files call.
+        """
+        args = ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"]
+
+        with subprocess.Popen(args, cwd=directory, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+            pending = b""
+            previous = None
+
+            for chunk in iter(lambda: proc.stdout.read(READ_CHUNK_SIZE), b""):
+                *paths, pending = (pending + chunk).split(b"\0")
+
+                for path in paths:
+                    # unmerged files are listed once per stage, next to each other
+                    if path != previous:
+                        yield directory / os.fsdecode(path)
+
+                    previous = path
+
+        if proc.returncode != 0:
+            logger.warning(f"git ls-files failed in {directory} (exit code {proc.returncode})")
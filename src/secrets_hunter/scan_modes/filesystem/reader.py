@@ -1,21 +1,108 @@
+import io
 import logging
+import mmap
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, TextIO
 
-from secrets_hunter.scan_modes.base.reader import SourceTextReader
+from secrets_hunter.config.settings import FileSettings
+from secrets_hunter.validators import TextContentValidator
 
 logger = logging.getLogger(__name__)
 
 
 class FileReader:
+    @staticmethod
+    def open_text(filepath: Path) -> TextIO | None:
+        """
+        Open a file for reading text, or return None when it is binary.
+        The binary check looks at the first block of the same handle, so a file is opened once.
+        """
+        f = open(filepath, 'rb')
+
+        try:
+            head = f.peek(FileSettings.BINARY_DETECTION_CHUNK_SIZE)[:FileSettings.BINARY_DETECTION_CHUNK_SIZE]
+
+            if not TextContentValidator.is_text_content(head):
+                f.close()
+                return None
+
+            return io.TextIOWrapper(f, encoding='utf-8', errors='replace')
+        except BaseException:
+            f.close()
+            raise
+
+    @staticmethod
+    @contextmanager
+    def map_file(filepath: Path) -> Iterator[mmap.mmap | None]:
+        """Map a file read-only, yielding None when it is binary."""
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if not TextContentValidator.is_text_content(data[:FileSettings.BINARY_DETECTION_CHUNK_SIZE]):
+                yield None
+            else:
+                yield data
+
+    @staticmethod
+    def is_plain_ascii(data: mmap.mmap) -> bool:
+        """
+        Whether mapped content reads the same as bytes and as text: ASCII without
+        CR, which text mode would translate, so no line needs decoding to be searched.
+        """
+        chunk_size = FileSettings.MMAP_CHECK_CHUNK_SIZE
+
+        for offset in range(0, len(data), chunk_size):
+            chunk = data[offset:offset + chunk_size]
+
+            if not chunk.isascii() or b'\r' in chunk:
+                return False
+
+        return True
+
+    @staticmethod
+    def decode_mapped(data: mmap.mmap) -> str:
+        """Decode mapped content as read_text would, translating CRLF and CR line breaks to LF."""
+        text = str(data, 'utf-8', 'replace')
+
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        return text
+
     @staticmethod
     def read_file(filepath: Path) -> Iterator[str]:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                for line in SourceTextReader.safe_lines(f):
-                    yield line
+            text_file = FileReader.open_text(filepath)
+
+            if text_file is None:
+                return
+
+            with text_file as f:
+                yield from f
 
         except OSError as e:
             print("\n")
             logger.error(f"Error reading {filepath}: {e}")
+
+    @staticmethod
+    def read_text(filepath: Path) -> str:
+        try:
+            text_file = FileReader.open_text(filepath)
+
+            if text_file is None:
+                return ""
+
+            with text_file as f:
+                return f.read()
+
+        except OSError as e:
+            print("\n")
+            logger.error(f"Error reading {filepath}: {e}")
+            return ""
+
+    @staticmethod
+    def file_size(filepath: Path) -> int:
+        try:
+            return filepath.stat().st_size
+        except OSError:
+            return 0
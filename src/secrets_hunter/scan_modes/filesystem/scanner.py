@@ -1,23 +1,33 @@
 import logging
+import os
 
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from secrets_hunter.config import CLIArgs
+from secrets_hunter.config.settings import FileSettings
+from secrets_hunter.detection.fragmenter.line_index import TEXT_MODE_BREAKS
 from secrets_hunter.models import Finding, ScanWorkItem
 from secrets_hunter.models.config import RuntimeConfig
-from secrets_hunter.scan_modes.base import BaseScanner
+from secrets_hunter.scan_modes.base import WorkerProcessScanner
+from secrets_hunter.scan_modes.filesystem.duplicates import DuplicateFiles
+from secrets_hunter.scan_modes.filesystem.git_files import GitFileLister
 from secrets_hunter.scan_modes.filesystem.reader import FileReader
+from secrets_hunter.scan_modes.filesystem.walker import DirectoryWalker
 
 
 logger = logging.getLogger(__name__)
 
 
-class FilesystemScanner(BaseScanner):
+class FilesystemScanner(WorkerProcessScanner):
     def __init__(self, runtime_cfg: RuntimeConfig, cli_args: CLIArgs | None, target: str):
         super().__init__(runtime_cfg, cli_args)
         self.file_reader = FileReader()
+        self.walker = DirectoryWalker(self.path_filter, self.cli_args.walk_workers)
         self.target = target
         self.target_path = Path(target)
+        self.duplicates = DuplicateFiles()
+        self.failed_files: list[Path] = []
 
         if self.target_path.is_file() or self.target_path.is_dir():
             self.set_base_path(target)
@@ -47,12 +57,71 @@ class FilesystemScanner(BaseScanner):
         logger.error(f"'{self.target}' is not a valid file or directory")
         return False
 
+    def scan(self) -> tuple[list[Finding], bool]:
+        self.duplicates = DuplicateFiles()
+        self.failed_files = []
+        findings, success = super().scan()
+        findings += self.rescan_copies_of_failed_files()
+
+        if self.duplicates.copies:
+            logger.info(f"Skipped {self.duplicates.copy_count} file(s) identical to a scanned file")
+            findings = self.copy_findings_to_duplicates(findings)
+
+        return findings, success
+
+    def item_failed(self, item: ScanWorkItem) -> None:
+        self.failed_files.append(item.task)
+
+    def rescan_copies_of_failed_files(self) -> list[Finding]:
+        """Scan one copy of each file that failed to scan in its place, its findings then cover the other copies."""
+        findings: list[Finding] = []
+
+        for original in self.failed_files:
+            copies = self.duplicates.copies.pop(original, [])
+
+            for index, copy in enumerate(copies):
+                copy_findings, success = self.rescan_task(copy, str(copy))
+
+                if success:
+                    findings.extend(copy_findings)
+
+                    if copies[index + 1:]:
+                        self.duplicates.copies[copy] = copies[index + 1:]
+
+                    break
+
+        return findings
+
+    def copy_findings_to_duplicates(self, findings: list[Finding]) -> list[Finding]:
+        """Report the findings of every scanned file for each of its skipped copies as well."""
+        format_filepath = self.pattern_detector.format_filepath
+        copies = {
+            format_filepath(str(original)): [format_filepath(str(copy)) for copy in copies]
+            for original, copies in self.duplicates.copies.items()
+        }
+        copied = [
+            finding.with_file(copy)
+            for finding in findings
+            for copy in copies.get(finding.file, ())
+        ]
+
+        return findings + copied
+
+    def stream_work_items(self) -> Iterator[ScanWorkItem] | None:
+        if not self.target_path.is_dir():
+            return None
+
+        display_path = Path.cwd() if self.target == "." else self.target
+        logger.info(f"Scanning files from {display_path} as they are collected...")
+        return self.unique_work_items(self.iter_files_to_scan(self.target_path))
+
     def collect_work_items(self) -> list[ScanWorkItem]:
         if self.target_path.is_file():
             return [
                 ScanWorkItem(
                     label=str(self.target_path),
-                    run=lambda: self.scan_file(self.target_path, show_progress=True)
+                    run=lambda: self.scan_file(self.target_path, show_progress=True),
+                    task=self.target_path
                 )
             ]
 
@@ -60,41 +129,91 @@ class FilesystemScanner(BaseScanner):
         logger.info(f"Collecting files from {display_path}...")
         files = self.collect_files_to_scan(self.target_path)
 
-        return [
-            ScanWorkItem(
-                label=str(filepath),
-                run=lambda filepath=filepath: self.scan_file(filepath, show_progress=False)
-            )
-            for filepath in files
-        ]
+        return list(self.unique_work_items(files))
+
+    def file_work_item(self, filepath: Path, size: int | None = None) -> ScanWorkItem:
+        return ScanWorkItem(
+            label=str(filepath),
+            run=lambda: self.scan_file(filepath, show_progress=False),
+            task=filepath,
+            size=self.file_reader.file_size(filepath) if size is None else size
+        )
+
+    def unique_work_items(self, files: Iterable[Path]) -> Iterator[ScanWorkItem]:
+        """Work items for files, leaving out copies of a file already yielded."""
+        for filepath in files:
+            try:
+                stat = filepath.stat()
+            except OSError:
+                yield self.file_work_item(filepath, 0)
+                continue
+
+            if self.duplicates.original_of(filepath, stat) is None:
+                yield self.file_work_item(filepath, stat.st_size)
+
+    def worker_kwargs(self) -> dict:
+        return {"target": self.target}
+
+    def scan_task(self, task: Path) -> tuple[list[Finding], bool]:
+        return self.scan_file(task)
 
     def collect_files_to_scan(self, target_path: Path) -> list[Path]:
+        return list(self.iter_files_to_scan(target_path))
+
+    def iter_files_to_scan(self, target_path: Path) -> Iterator[Path]:
         if target_path.is_file():
-            if self.path_filter.is_ignored_path(target_path):
-                return []
+            if not self.path_filter.is_ignored_path(target_path):
+                yield target_path
 
-            return [target_path] if self.text_content_validator.is_text_file(target_path) else []
+            return
 
-        files: list[Path] = []
-        dirs_to_process = [target_path]
+        if self.cli_args.respect_gitignore:
+            if GitFileLister.is_work_tree(target_path):
+                yield from self._git_visible_files(target_path)
+                return
 
-        while dirs_to_process:
-            current_dir = dirs_to_process.pop()
+            logger.warning(f"{target_path} is not inside a git work tree, scanning without .gitignore rules")
 
-            try:
-                for item in current_dir.iterdir():
-                    if self.path_filter.is_ignored_path(item):
-                        continue
+        yield from self.walker.walk(target_path)
 
-                    if item.is_dir():
-                        dirs_to_process.append(item)
-                    elif self.text_content_validator.is_text_file(item):
-                        files.append(item)
-            except (PermissionError, OSError):
-                pass
+    def _git_visible_files(self, target_path: Path) -> Iterator[Path]:
+        for path in GitFileLister.iter_files(target_path):
+            if self.path_filter.is_ignored_path(path):
+                continue
 
-        return files
+            # skips submodules and tracked files deleted from the work tree
+            if os.path.isfile(path):
+                yield path
 
     def scan_file(self, filepath: Path, show_progress: bool = False) -> tuple[list[Finding], bool]:
+        # the line engine streams files, only the buffer engine needs a large one whole
+        if self.scans_buffers and self.file_reader.file_size(filepath) >= FileSettings.MMAP_MIN_FILE_SIZE:
+            result = self._scan_mapped_file(filepath, show_progress)
+
+            if result is not None:
+                return result
+
+        if self.scans_buffers:
+            text = self.file_reader.read_text(filepath)
+            return self.scan_text(text, filepath, show_progress, breaks=TEXT_MODE_BREAKS)
+
         lines = self.file_reader.read_file(filepath)
         return self.scan_lines(lines, filepath, show_progress)
+
+    def _scan_mapped_file(self, filepath: Path, show_progress: bool) -> tuple[list[Finding], bool] | None:
+        """Scan a large file through a memory map, or return None when it cannot be mapped."""
+        try:
+            with self.file_reader.map_file(filepath) as data:
+                if data is None:
+                    return [], True
+
+                if self.file_reader.is_plain_ascii(data):
+                    return self.scan_mapped(data, filepath, show_progress)
+
+                # decoded from the map, so the file is not read a second time
+                text = self.file_reader.decode_mapped(data)
+                return self.scan_text(text, filepath, show_progress, breaks=TEXT_MODE_BREAKS)
+
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cannot map {filepath}, reading it as text: {e}")
+            return None
@@ -0,0 +1,120 @@
+import os
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Iterator
+
+from secrets_hunter.filters import PathFilter
+
+# (st_dev, st_ino) of a directory
+DirKey = tuple[int, int]
+
+
+class DirectoryWalker:
+    """
+    Walks a directory tree and yields the regular files that are not ignored.
+    Files are not opened here; binary files are recognized when they are read.
+
+    Each directory is listed by one task; with more than one worker the tasks
+    run on a thread pool, so metadata latency of slow filesystems overlaps.
+    Directories are keyed by (st_dev, st_ino) and entered at most once, which
+    stops symlink loops.
+    """
+
+    def __init__(self, path_filter: PathFilter, workers: int = 1):
+        self.path_filter = path_filter
+        self.workers = workers
+
+    @staticmethod
+    def dir_key(path: Path) -> DirKey | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        return st.st_dev, st.st_ino
+
+    def walk(self, root: Path) -> Iterator[Path]:
+        visited: set[DirKey] = set()
+        root_key = self.dir_key(root)
+
+        if root_key is not None:
+            visited.add(root_key)
+
+        root_dev = root_key[0] if root_key is not None else 0
+
+        if self.workers > 1:
+            yield from self._walk_parallel((root, root_dev), visited)
+        else:
+            yield from self._walk_sequential((root, root_dev), visited)
+
+    def list_dir(self, directory: Path, dev: int) -> tuple[list[tuple[Path, DirKey]], list[Path]]:
+        """
+        Return the subdirectories to enter and the files to scan of one directory,
+        whose st_dev is dev.
+
+        DirEntry caches the entry type and inode from the directory listing, so a
+        subdirectory is keyed by dev and its inode without a stat; only symlinks
+        to directories are stat'ed, since their target may be anywhere.
+        """
+        subdirs: list[tuple[Path, DirKey]] = []
+        files: list[Path] = []
+
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return subdirs, files
+
+        with entries:
+            for entry in entries:
+                item = directory / entry.name
+
+                try:
+                    if entry.is_dir():
+                        if self.path_filter.is_ignored_dir(item):
+                            continue
+
+                        if entry.is_symlink():
+                            st = entry.stat()
+                            subdirs.append((item, (st.st_dev, st.st_ino)))
+                        else:
+                            subdirs.append((item, (dev, entry.inode())))
+                    elif entry.is_file() and not self.path_filter.is_ignored_path(item):
+                        files.append(item)
+                except OSError:
+                    continue
+
+        return subdirs, files
+
+    @staticmethod
+    def _unvisited(subdirs: list[tuple[Path, DirKey]], visited: set[DirKey]) -> Iterator[tuple[Path, int]]:
+        for subdir, key in subdirs:
+            if key not in visited:
+                visited.add(key)
+                yield subdir, key[0]
+
+    def _walk_sequential(self, root: tuple[Path, int], visited: set[DirKey]) -> Iterator[Path]:
+        dirs_to_process = [root]
+
+        while dirs_to_process:
+            subdirs, files = self.list_dir(*dirs_to_process.pop())
+            dirs_to_process.extend(self._unvisited(subdirs, visited))
+            yield from files
+
+    def _walk_parallel(self, root: tuple[Path, int], visited: set[DirKey]) -> Iterator[Path]:
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="walker")
+
+        try:
+            pending = {pool.submit(self.list_dir, *root)}
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    subdirs, files = future.result()
+                    pending.update(
+                        pool.submit(self.list_dir, subdir, dev) for subdir, dev in self._unvisited(subdirs, visited)
+                    )
+                    yield from files
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
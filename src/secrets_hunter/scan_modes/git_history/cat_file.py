@@ -0,0 +1,124 @@
+import re
+import subprocess
+
+from pathlib import Path
+from threading import BoundedSemaphore, Lock
+
+# Header of an object found by `git cat-file --batch`: "<oid> <type> <size>"
+OBJECT_HEADER_RE = re.compile(rb"\A(?:[0-9a-f]{40}|[0-9a-f]{64}) (\w+) (\d+)\n\Z")
+
+
+class CatFileProcess:
+    """A long-lived `git cat-file --batch` process, answering one object request at a time."""
+
+    def __init__(self, repo_root: Path):
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+    def read_blob(self, object_name: str) -> bytes | None:
+        """Return the content of a blob, or None when the object is missing or not a blob."""
+        self.proc.stdin.write(object_name.encode("utf-8", errors="surrogateescape") + b"\n")
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline()
+
+        if not header:
+            raise EOFError("git cat-file exited")
+
+        match = OBJECT_HEADER_RE.match(header)
+
+        # "<object> missing" and "<object> ambiguous" are not followed by content
+        if not match:
+            return None
+
+        size = int(match.group(2))
+        content = self.proc.stdout.read(size + 1)
+
+        if len(content) != size + 1:
+            raise EOFError("git cat-file exited before sending the whole object")
+
+        return content[:-1] if match.group(1) == b"blob" else None
+
+    def close(self) -> None:
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+        self.proc.stdout.close()
+
+
+class CatFilePool:
+    """
+    Up to max_processes `git cat-file --batch` processes shared by the threads
+    of a scan. Processes are started when no idle one is left, so a worker
+    process scanning on a single thread only ever starts one.
+    """
+
+    def __init__(self, repo_root: Path, max_processes: int = 1):
+        self.repo_root = repo_root
+        self._slots = BoundedSemaphore(max_processes)
+        self._lock = Lock()
+        self._idle: list[CatFileProcess] = []
+        self._processes: list[CatFileProcess] = []
+        self._closed = False
+
+    def read_blob(self, object_name: str) -> bytes | None:
+        with self._slots:
+            process = self._acquire()
+
+            try:
+                content = process.read_blob(object_name)
+            except BaseException:
+                # its pipes may be out of step with the requests now
+                self._discard(process)
+                raise
+
+            self._release(process)
+            return content
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            processes, self._processes, self._idle = self._processes, [], []
+
+        for process in processes:
+            process.close()
+
+    def _acquire(self) -> CatFileProcess:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("git cat-file pool is closed")
+
+            if self._idle:
+                return self._idle.pop()
+
+            process = CatFileProcess(self.repo_root)
+            self._processes.append(process)
+            return process
+
+    def _release(self, process: CatFileProcess) -> None:
+        with self._lock:
+            if not self._closed:
+                self._idle.append(process)
+                return
+
+        process.close()
+
+    def _discard(self, process: CatFileProcess) -> None:
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+
+        process.proc.kill()
+        process.close()
@@ -0,0 +1,47 @@
+from collections import defaultdict
+from typing import Iterable
+
+from secrets_hunter.scan_modes.git_history.reader import AddedLineRanges, GitBlobRef
+
+
+class DuplicateBlobs:
+    """
+    Recognizes changed blobs that need no scan of their own, because the same
+    blob object was already scanned at other (commit, path) pairs that added
+    every line this pair adds.
+
+    Findings of a blob only depend on its content, so the findings of such a
+    copy are those the scanned pairs reported on the lines the copy adds.
+    """
+
+    def __init__(self):
+        self.scanned: dict[str, list[GitBlobRef]] = defaultdict(list)
+        self.copies: list[GitBlobRef] = []
+        # lines reported by the scanned pairs of each blob, touching ranges merged
+        self._covered: dict[str, AddedLineRanges] = {}
+
+    @property
+    def copy_count(self) -> int:
+        return len(self.copies)
+
+    def is_copy(self, blob: GitBlobRef) -> bool:
+        """Record blob and return whether the findings of already scanned pairs cover it."""
+        if blob.blob_sha is None or blob.added_lines is None:
+            return False
+
+        covered = self._covered.get(blob.blob_sha)
+
+        if covered is not None and blob.added_lines.issubset(covered):
+            self.copies.append(blob)
+            return True
+
+        self._covered[blob.blob_sha] = blob.added_lines.union(covered or AddedLineRanges())
+        self.scanned[blob.blob_sha].append(blob)
+        return False
+
+    def take_copies_of(self, failed: Iterable[GitBlobRef]) -> list[GitBlobRef]:
+        """Remove and return the copies of blobs that had a scanned pair fail, since their findings are incomplete."""
+        failed_blobs = {blob.blob_sha for blob in failed}
+        taken = [copy for copy in self.copies if copy.blob_sha in failed_blobs]
+        self.copies = [copy for copy in self.copies if copy.blob_sha not in failed_blobs]
+        return taken
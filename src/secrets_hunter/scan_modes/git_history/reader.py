@@ -1,68 +1,309 @@
 import logging
 import re
 import subprocess
+import tempfile
 
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
+
+from secrets_hunter.scan_modes.git_history.cat_file import CatFilePool
 
 logger = logging.getLogger(__name__)
 
 DIFF_HUNK_RE = re.compile(r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+DIFF_HUNK_BYTES_RE = re.compile(DIFF_HUNK_RE.pattern.encode("ascii"))
 COMMIT_SHA_RE = re.compile(r"\A(?:[0-9a-f]{40}|[0-9a-f]{64})\Z")
+READ_CHUNK_SIZE = 64 * 1024
+# Header printed by `git log --format` before the raw changes of each commit
+COMMIT_HEADER_PREFIX = b"commit "
+SCANNED_CHANGE_TYPES = (b"A", b"M")
+
+
+C_ESCAPES = {b"a": 7, b"b": 8, b"t": 9, b"n": 10, b"v": 11, b"f": 12, b"r": 13, b'"': 34, b"\\": 92}
+C_ESCAPE_RE = re.compile(rb'\\([0-7]{3}|.)')
+
+
+def unquote_diff_path(name: bytes) -> str:
+    """Path of a ---/+++ patch line, which git C-quotes when it holds special characters."""
+    # git appends a tab to names containing spaces
+    if name.endswith(b"\t"):
+        name = name[:-1]
+
+    if name.startswith(b'"') and name.endswith(b'"'):
+        name = C_ESCAPE_RE.sub(
+            lambda m: bytes([int(m.group(1), 8) if len(m.group(1)) == 3 else C_ESCAPES.get(m.group(1), m.group(1)[0])]),
+            name[1:-1]
+        )
+
+    return name.decode("utf-8", errors="replace")
+
+
+@dataclass(frozen=True)
+class AddedLineRanges:
+    """Line numbers added to a file by a commit, as sorted half-open ranges."""
+
+    starts: tuple[int, ...] = ()
+    stops: tuple[int, ...] = ()
+
+    def __contains__(self, line: int) -> bool:
+        i = bisect_right(self.starts, line) - 1
+        return i >= 0 and line < self.stops[i]
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __len__(self) -> int:
+        return sum(stop - start for start, stop in zip(self.starts, self.stops))
+
+    def ranges(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.stops)
+
+    def union(self, other: "AddedLineRanges") -> "AddedLineRanges":
+        starts: list[int] = []
+        stops: list[int] = []
+
+        for start, stop in sorted([*self.ranges(), *other.ranges()]):
+            if stops and start <= stops[-1]:
+                stops[-1] = max(stops[-1], stop)
+            else:
+                starts.append(start)
+                stops.append(stop)
+
+        return AddedLineRanges(tuple(starts), tuple(stops))
+
+    def issubset(self, other: "AddedLineRanges") -> bool:
+        """Whether other holds every line of self; other must have no overlapping or touching ranges."""
+        for start, stop in self.ranges():
+            i = bisect_right(other.starts, start) - 1
+
+            if i < 0 or stop > other.stops[i]:
+                return False
+
+        return True
+
+
+NO_ADDED_LINES = AddedLineRanges()
+
+
+@dataclass(frozen=True)
+class GitBlobRef:
+    commit_sha: str
+    repo_rel_path: str
+    blob_sha: str | None = None
+    # None when the blob was not listed by iter_commit_changes
+    added_lines: AddedLineRanges | None = field(default=None, compare=False, repr=False)
+
+
+class ChunkStream:
+    """Reads delimited tokens from a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        chunk = next(self._chunks, b"")
+
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def read_until(self, delimiter: bytes) -> bytes | None:
+        """The next token up to delimiter, the rest of the stream at its end, or None once exhausted."""
+        end = self._buffer.find(delimiter, self._pos)
+
+        if end >= 0:
+            token = self._buffer[self._pos:end]
+            self._pos = end + len(delimiter)
+            return token
+
+        # a token spanning chunks is collected in parts and joined once, not copied again for every chunk
+        parts = []
+
+        while end < 0:
+            # only the bytes a delimiter split across chunks may start with are carried into the next one
+            kept = max(len(self._buffer) - len(delimiter) + 1, self._pos)
+            parts.append(self._buffer[self._pos:kept])
+            self._pos = kept
+
+            if not self._fill():
+                parts.append(self._buffer[self._pos:])
+                self._pos = len(self._buffer)
+                token = b"".join(parts)
+                return token if token else None
+
+            end = self._buffer.find(delimiter)
+
+        parts.append(self._buffer[:end])
+        self._pos = end + len(delimiter)
+        return b"".join(parts)
+
+    def peek(self, size: int) -> bytes:
+        while len(self._buffer) - self._pos < size and self._fill():
+            pass
+
+        return self._buffer[self._pos:self._pos + size]
 
 
 class GitHistoryReader:
     """Read commit-selected file blobs from a git repository."""
 
-    def __init__(self, target: Path):
+    def __init__(self, target: Path, blob_readers: int = 1):
         self.target = Path(target).resolve()
         self._repo_root = self._find_repo_root(self._git_cwd())
+        # blobs are read through long-lived git cat-file processes, at most one per concurrent reader
+        self._cat_file = CatFilePool(self._repo_root, blob_readers)
 
     @property
     def repo_root(self) -> Path:
         return self._repo_root
 
-    def list_commits(self, revset: str, max_count: int | None = None) -> list[str]:
-        args = ["rev-list", "--reverse"]
+    def iter_commit_changes(
+        self,
+        revset: str,
+        max_count: int | None = None
+    ) -> Iterator[tuple[str, list[GitBlobRef]]]:
+        """
+        Yield every commit selected by revset, oldest first, with the files it added
+        or modified and the lines added to them, streamed from a single git log call
+        while git is still walking.
+        """
+        args = [
+            "git", "-c", "log.showRoot=true", "-c", "core.quotePath=false", "log",
+            "--reverse", "--raw", "-z", "--no-renames", "--no-abbrev", "--no-show-signature",
+            "-p", "--unified=0", "--no-ext-diff", "--no-textconv", "--no-color",
+            "--src-prefix=a/", "--dst-prefix=b/",
+            "--format=commit %H"
+        ]
 
         if max_count is not None:
             args.extend(["--max-count", str(max_count)])
 
-        args.append("--end-of-options")
-        args.append(revset)
-        output = self._run_git_text(args)
+        # --diff-filter would also drop commits from the walk, so other changes are skipped here
+        args.extend(["--end-of-options", revset])
+
+        with tempfile.TemporaryFile() as stderr:
+            with subprocess.Popen(args, cwd=self.repo_root, stdout=subprocess.PIPE, stderr=stderr) as proc:
+                yield from self._parse_log(iter(lambda: proc.stdout.read(READ_CHUNK_SIZE), b""))
+
+            if proc.returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode("utf-8", errors="replace").strip()
+                raise RuntimeError(f"git log {revset} failed: {message}")
+
+    @classmethod
+    def _parse_log(cls, chunks: Iterator[bytes]) -> Iterator[tuple[str, list[GitBlobRef]]]:
+        """
+        Parse `git log --raw -z -p` output. Each commit header and raw change is
+        NUL-terminated, an empty token ends the raw changes and the patch that
+        follows is line-oriented up to the next commit header.
+        """
+        stream = ChunkStream(chunks)
+        commit_sha: str | None = None
+        changes: list[tuple[str, str]] = []
+        added_lines: dict[str, AddedLineRanges] = {}
+
+        def commit_blobs() -> list[GitBlobRef]:
+            return [
+                GitBlobRef(commit_sha, path, blob_sha, added_lines.get(path, NO_ADDED_LINES))
+                for path, blob_sha in changes
+            ]
+
+        while (token := stream.read_until(b"\0")) is not None:
+            token = token.lstrip(b"\n")
+
+            if token.startswith(b":"):
+                path = stream.read_until(b"\0") or b""
+                fields = token.split()
+
+                if fields[-1] in SCANNED_CHANGE_TYPES:
+                    changes.append((path.decode("utf-8", errors="replace"), fields[3].decode("ascii")))
+            elif token.startswith(COMMIT_HEADER_PREFIX):
+                if commit_sha is not None:
+                    yield commit_sha, commit_blobs()
+
+                commit_sha = token[len(COMMIT_HEADER_PREFIX):].decode("ascii")
+                changes = []
+                added_lines = {}
+            elif not token:
+                added_lines = cls._parse_patch(stream)
+
+        if commit_sha is not None:
+            yield commit_sha, commit_blobs()
 
-        if not output:
-            return []
-
-        return [line for line in output.splitlines() if line]
+    @staticmethod
+    def _parse_patch(stream: "ChunkStream") -> dict[str, AddedLineRanges]:
+        """Added line ranges of every file in a --unified=0 patch, keyed by path."""
+        ranges: dict[str, tuple[list[int], list[int]]] = {}
+        path: str | None = None
+        in_header = False
+
+        while stream.peek(len(COMMIT_HEADER_PREFIX)) not in (COMMIT_HEADER_PREFIX, b""):
+            line = stream.read_until(b"\n")
+
+            if line.startswith(b"diff --git "):
+                path = None
+                in_header = True
+            elif in_header and line.startswith(b"+++ "):
+                path = None if line == b"+++ /dev/null" else unquote_diff_path(line[4:])[2:]
+            elif line.startswith(b"@@ "):
+                in_header = False
+                match = DIFF_HUNK_BYTES_RE.match(line)
+
+                if match and path is not None:
+                    start_line = int(match.group(1))
+                    line_count = int(match.group(2) or b"1")
+
+                    if line_count:
+                        starts, stops = ranges.setdefault(path, ([], []))
+                        starts.append(start_line)
+                        stops.append(start_line + line_count)
+
+        return {
+            path: AddedLineRanges(tuple(starts), tuple(stops))
+            for path, (starts, stops) in ranges.items()
+        }
 
-    def list_changed_files(self, commit_sha: str) -> list[str]:
+    def read_blob(self, commit_sha: str, repo_rel_path: str) -> bytes | None:
         self._validate_commit_sha(commit_sha)
 
-        output = self._run_git_bytes([
-            "diff-tree",
-            "--root",
-            "--no-commit-id",
-            "--name-only",
-            "-r",
-            "-z",
-            "--diff-filter=AM",
-            "--end-of-options",
-            commit_sha
-        ])
+        # cat-file reads one object name per line
+        if "\n" in repo_rel_path:
+            return self._show_blob(commit_sha, repo_rel_path)
 
-        if not output:
-            return []
+        try:
+            content = self._cat_file.read_blob(f"{commit_sha}:{repo_rel_path}")
+        except (OSError, EOFError) as e:
+            logger.debug("git cat-file failed on %s:%s, using git show: %s", commit_sha, repo_rel_path, e)
+            return self._show_blob(commit_sha, repo_rel_path)
 
-        return [
-            path.decode("utf-8", errors="replace")
-            for path in output.split(b"\0")
-            if path
-        ]
+        if content is None:
+            logger.debug("Unable to read git blob %s:%s", commit_sha, repo_rel_path)
 
-    def read_blob(self, commit_sha: str, repo_rel_path: str) -> bytes | None:
-        self._validate_commit_sha(commit_sha)
+        return content
+
+    def close(self) -> None:
+        """Stop the git cat-file processes."""
+        self._cat_file.close()
+
+    def __enter__(self) -> "GitHistoryReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
+    def _show_blob(self, commit_sha: str, repo_rel_path: str) -> bytes | None:
         result = subprocess.run(
             ["git", "show", "--end-of-options", f"{commit_sha}:{repo_rel_path}"],
             cwd=self.repo_root,
@@ -81,7 +322,7 @@ class GitHistoryReader:
         )
         return None
 
-    def list_added_lines(self, commit_sha: str, repo_rel_path: str) -> set[int]:
+    def list_added_lines(self, commit_sha: str, repo_rel_path: str) -> AddedLineRanges:
         self._validate_commit_sha(commit_sha)
 
         diff = self._run_git_text([
@@ -97,7 +338,8 @@ class GitHistoryReader:
             repo_rel_path
         ])
 
-        added_lines: set[int] = set()
+        starts: list[int] = []
+        stops: list[int] = []
 
         for line in diff.splitlines():
             match = DIFF_HUNK_RE.match(line)
@@ -108,10 +350,11 @@ class GitHistoryReader:
             start_line = int(match.group(1))
             line_count = int(match.group(2) or "1")
 
-            for line_number in range(start_line, start_line + line_count):
-                added_lines.add(line_number)
+            if line_count:
+                starts.append(start_line)
+                stops.append(start_line + line_count)
 
-        return added_lines
+        return AddedLineRanges(tuple(starts), tuple(stops))
 
     def target_matches(self, target_path: Path, repo_rel_path: str) -> bool:
         resolved_target = target_path.resolve()
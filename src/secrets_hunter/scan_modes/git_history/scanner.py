@@ -1,26 +1,21 @@
 import logging
 
-from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
+from typing import Iterator
 
 from secrets_hunter.config import CLIArgs
 from secrets_hunter.models import Finding, ScanWorkItem
 from secrets_hunter.models.config import RuntimeConfig
-from secrets_hunter.scan_modes.base import BaseScanner
-from secrets_hunter.scan_modes.git_history.reader import GitHistoryReader
+from secrets_hunter.scan_modes.base import WorkerProcessScanner
+from secrets_hunter.scan_modes.git_history.duplicates import DuplicateBlobs
+from secrets_hunter.scan_modes.git_history.reader import AddedLineRanges, GitBlobRef, GitHistoryReader
 from secrets_hunter.validators import TextContentValidator
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
-class GitBlobRef:
-    commit_sha: str
-    repo_rel_path: str
-
-
-class GitHistoryScanner(BaseScanner):
+class GitHistoryScanner(WorkerProcessScanner):
     def __init__(
         self,
         runtime_cfg: RuntimeConfig,
@@ -35,6 +30,9 @@ class GitHistoryScanner(BaseScanner):
         self.revset = revset
         self.max_count = max_count
         self._empty_message = "No changed files to scan"
+        self._git_reader: GitHistoryReader | None = None
+        self.duplicates = DuplicateBlobs()
+        self.failed_blobs: list[GitBlobRef] = []
 
     def found_message(self, total_items: int) -> str:
         return f"Got {total_items} git blob(s) to scan"
@@ -51,53 +49,159 @@ class GitHistoryScanner(BaseScanner):
     def failed_unit_label(self) -> str:
         return "git blob"
 
+    @property
+    def git_reader(self) -> GitHistoryReader:
+        if self._git_reader is None:
+            self._git_reader = GitHistoryReader(self.target_path, blob_readers=self.cli_args.max_workers)
+
+        return self._git_reader
+
+    def scan(self) -> tuple[list[Finding], bool]:
+        self.duplicates = DuplicateBlobs()
+        self.failed_blobs = []
+
+        try:
+            findings, success = super().scan()
+            findings += self.rescan_copies_of_failed_blobs()
+
+            if self.duplicates.copies:
+                logger.info(f"Skipped {self.duplicates.copy_count} git blob(s) already scanned in another commit")
+                findings = self.copy_findings_to_duplicates(findings)
+
+            return findings, success
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._git_reader is not None:
+            self._git_reader.close()
+            self._git_reader = None
+
+    def item_failed(self, item: ScanWorkItem) -> None:
+        self.failed_blobs.append(item.task)
+
+    def rescan_copies_of_failed_blobs(self) -> list[Finding]:
+        """Scan the copies of blobs whose scan failed at another pair, which have no findings to copy."""
+        findings: list[Finding] = []
+
+        for copy in self.duplicates.take_copies_of(self.failed_blobs):
+            findings.extend(self.rescan_task(copy, self._blob_label(copy))[0])
+
+        return findings
+
+    def copy_findings_to_duplicates(self, findings: list[Finding]) -> list[Finding]:
+        """Report the findings of scanned blobs for each skipped copy, on the lines the copy adds."""
+        display_file = self._display_file
+        scanned_blob = {
+            (display_file(blob), blob.commit_sha): blob.blob_sha
+            for blobs in self.duplicates.scanned.values()
+            for blob in blobs
+        }
+        # findings on each line of a blob, from the first scanned pair that reported on that line
+        blob_lines: dict[str, dict[int, list[Finding]]] = {}
+        line_sources: dict[tuple[str, int], tuple[str, str]] = {}
+
+        for finding in findings:
+            source = (finding.file, finding.commit)
+            blob_sha = scanned_blob.get(source)
+
+            if blob_sha is not None and line_sources.setdefault((blob_sha, finding.line), source) == source:
+                blob_lines.setdefault(blob_sha, {}).setdefault(finding.line, []).append(finding)
+
+        copied = []
+
+        for copy in self.duplicates.copies:
+            file = display_file(copy)
+
+            for line, line_findings in blob_lines.get(copy.blob_sha, {}).items():
+                if line in copy.added_lines:
+                    copied.extend(
+                        (finding if finding.file == file else finding.with_file(file)).with_commit(copy.commit_sha)
+                        for finding in line_findings
+                    )
+
+        return findings + copied
+
+    @staticmethod
+    def _blob_label(blob: GitBlobRef) -> str:
+        return f"{blob.commit_sha[:12]}:{blob.repo_rel_path}"
+
+    def _display_file(self, blob: GitBlobRef) -> str:
+        return self.pattern_detector.format_filepath(str(self.git_reader.repo_root / blob.repo_rel_path))
+
+    def worker_kwargs(self) -> dict:
+        return {"target": self.target, "revset": self.revset, "max_count": self.max_count}
+
+    def scan_task(self, task: GitBlobRef) -> tuple[list[Finding], bool]:
+        return self.scan_git_blob(self.git_reader, task.commit_sha, task.repo_rel_path, task.added_lines)
+
+    def stream_work_items(self) -> Iterator[ScanWorkItem] | None:
+        git_reader = self.git_reader
+        self.set_base_path(str(git_reader.repo_root))
+
+        logger.info(f"Scanning commits from git revset {self.revset!r} as they are listed...")
+        return (self.blob_work_item(git_reader, blob) for blob in self.iter_git_blobs(git_reader))
+
     def collect_work_items(self) -> list[ScanWorkItem]:
-        git_reader = GitHistoryReader(self.target_path)
+        git_reader = self.git_reader
         self.set_base_path(str(git_reader.repo_root))
 
         logger.info(f"Collecting commits from git revset {self.revset!r}...")
         blobs = self.collect_git_blobs(git_reader)
 
-        return [
-            ScanWorkItem(
-                label=f"{blob.commit_sha[:12]}:{blob.repo_rel_path}",
-                run=partial(
-                    self.scan_git_blob,
-                    git_reader,
-                    blob.commit_sha,
-                    blob.repo_rel_path
-                )
-            )
-            for blob in blobs
-        ]
+        return [self.blob_work_item(git_reader, blob) for blob in blobs]
+
+    def blob_work_item(self, git_reader: GitHistoryReader, blob: GitBlobRef) -> ScanWorkItem:
+        return ScanWorkItem(
+            label=self._blob_label(blob),
+            run=partial(
+                self.scan_git_blob,
+                git_reader,
+                blob.commit_sha,
+                blob.repo_rel_path,
+                blob.added_lines
+            ),
+            task=blob
+        )
 
     def collect_git_blobs(self, git_reader: GitHistoryReader) -> list[GitBlobRef]:
-        commits = git_reader.list_commits(self.revset, max_count=self.max_count)
+        return list(self.iter_git_blobs(git_reader))
 
-        if not commits:
-            self._empty_message = "No commits selected"
-            return []
+    def iter_git_blobs(self, git_reader: GitHistoryReader) -> Iterator[GitBlobRef]:
+        commits_selected = False
+
+        for _, blobs in git_reader.iter_commit_changes(self.revset, max_count=self.max_count):
+            commits_selected = True
 
-        blobs: list[GitBlobRef] = []
+            for blob in blobs:
+                if not git_reader.target_matches(self.target_path, blob.repo_rel_path):
+                    continue
 
-        for commit_sha in commits:
-            for repo_rel_path in git_reader.list_changed_files(commit_sha):
-                if not git_reader.target_matches(self.target_path, repo_rel_path):
+                if self.path_filter.is_ignored_path(Path(blob.repo_rel_path)):
                     continue
 
-                if self.path_filter.is_ignored_path(Path(repo_rel_path)):
+                if self.duplicates.is_copy(blob):
                     continue
 
-                blobs.append(GitBlobRef(commit_sha, repo_rel_path))
+                yield blob
 
-        return blobs
+        if not commits_selected:
+            self._empty_message = "No commits selected"
 
     def scan_git_blob(
         self,
         git_reader: GitHistoryReader,
         commit_sha: str,
-        repo_rel_path: str
+        repo_rel_path: str,
+        added_lines: AddedLineRanges | None = None
     ) -> tuple[list[Finding], bool]:
+        if added_lines is None:
+            added_lines = git_reader.list_added_lines(commit_sha, repo_rel_path)
+
+        # a blob that adds no lines cannot introduce a finding
+        if not added_lines:
+            return [], True
+
         blob = git_reader.read_blob(commit_sha, repo_rel_path)
 
         if blob is None:
@@ -107,16 +211,15 @@ class GitHistoryScanner(BaseScanner):
             return [], True
 
         display_path = git_reader.repo_root / repo_rel_path
-        findings, success = self.scan_lines(self.source_text_reader.bytes_to_lines(blob), display_path)
+
+        if self.cli_args.git_added_lines_only:
+            findings, success = self.scan_line_ranges(blob, display_path, added_lines.ranges())
+        else:
+            findings, success = self.scan_bytes(blob, display_path)
 
         if not success:
             return findings, success
 
-        added_lines = git_reader.list_added_lines(commit_sha, repo_rel_path)
-
-        if not added_lines:
-            return [], True
-
         introduced_findings = [
             finding.with_commit(commit_sha)
             for finding in findings
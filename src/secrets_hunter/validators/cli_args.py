@@ -19,6 +19,8 @@ class CLIArgsValidator:
 
         self.validate_min_length(args.min_length)
         self.validate_workers(args.workers)
+        self.validate_walk_workers(args.walk_workers)
+        self.validate_line_window_size(args.line_window_size)
         self.validate_min_confidence(args.min_confidence)
         self.validate_git_args(args)
         self.validate_domain_args(args)
@@ -44,6 +46,9 @@ class CLIArgsValidator:
         if args.git_max_count is not None and not args.git_revset:
             self.parser.error("--git-max-count requires --git-revset")
 
+        if args.git_added_lines_only and not args.git_revset:
+            self.parser.error("--git-added-lines-only requires --git-revset")
+
     def validate_domain_args(self, args):
         if args.skip_tls_verify and not args.domain:
             self.parser.error("--skip-tls-verify requires --domain")
@@ -76,6 +81,16 @@ class CLIArgsValidator:
         if value > max_workers:
             self.parser.error(f"--workers cannot exceed {max_workers}")
 
+    def validate_walk_workers(self, value):
+        if value <= 0:
+            self.parser.error("--walk-workers must be > 0")
+
+    def validate_line_window_size(self, value):
+        min_size = settings.FileSettings.LINE_WINDOW_OVERLAP * 2
+
+        if value < min_size:
+            self.parser.error(f"--line-window-size must be >= {min_size}")
+
     def validate_output_args(self, args):
         if args.json_output and args.sarif_output:
             self.parser.error("--json and --sarif cannot be used together")
@@ -1,22 +1,13 @@
-from pathlib import Path
-
 from secrets_hunter.config.settings import FileSettings
 
+# Control bytes: <32 excluding \t \n \r, plus DEL (127)
+CONTROL_BYTES = bytes(b for b in range(32) if b not in (9, 10, 13)) + b'\x7f'
 
-class TextContentValidator:
-    @staticmethod
-    def is_text_file(path: Path) -> bool:
-        try:
-            with open(path, 'rb') as f:
-                chunk = f.read(FileSettings.BINARY_DETECTION_CHUNK_SIZE)
-
-            return TextContentValidator.is_text_content(chunk)
-        except OSError:
-            return False
 
+class TextContentValidator:
     @staticmethod
     def is_text_content(content: bytes) -> bool:
-        chunk = content[:FileSettings.BINARY_DETECTION_CHUNK_SIZE]
+        chunk = bytes(content[:FileSettings.BINARY_DETECTION_CHUNK_SIZE])
 
         # Empty file = text
         if not chunk:
@@ -26,12 +17,7 @@ class TextContentValidator:
         if b'\x00' in chunk:
             return False
 
-        # Count control bytes: <32 excluding \t \n \r, plus DEL (127)
-        bad = 0
-        for b in chunk:
-            if b == 127:
-                bad += 1
-            elif b < 32 and b not in (9, 10, 13):  # tab, LF, CR are fine
-                bad += 1
+        # Deleting the control bytes in C and comparing lengths counts them without a Python loop
+        bad = len(chunk) - len(chunk.translate(None, CONTROL_BYTES))
 
         return (bad / len(chunk)) < FileSettings.CONTROL_CHARS_RATIO_THRESHOLD
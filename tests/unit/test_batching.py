@@ -0,0 +1,91 @@
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from secrets_hunter.config import CLIArgs, load_runtime_config
+from secrets_hunter.config.settings import BatchSettings
+from secrets_hunter.models import ScanWorkItem
+from secrets_hunter.scan_modes.base.batching import BatchPipeline, plan_batches, run_batch, stream_batches
+from secrets_hunter.scan_modes.filesystem.scanner import FilesystemScanner
+
+
+def item(label: str, size: int = 0, run=None) -> ScanWorkItem:
+    return ScanWorkItem(label=label, run=run or (lambda: ([label], True)), size=size)
+
+
+class TestBatching(unittest.TestCase):
+    def test_batches_follow_byte_budget(self):
+        items = [item("big", size=3 * BatchSettings.BATCH_BYTES)] + [item(f"small{i}") for i in range(1000)]
+
+        with patch.object(BatchSettings, "MIN_BATCHES_PER_WORKER", 1):
+            batches = plan_batches(items, max_workers=1)
+
+        self.assertEqual([i.label for i in batches[0]], ["big"])
+        self.assertEqual(sum(len(b) for b in batches), len(items))
+        self.assertLess(len(batches), 10)
+
+    def test_small_scans_are_split_across_workers(self):
+        batches = plan_batches([item(str(i)) for i in range(40)], max_workers=4)
+        self.assertGreater(len(batches), 4)
+        self.assertLessEqual(len(batches), 4 * BatchSettings.MIN_BATCHES_PER_WORKER)
+
+    def test_run_batch_reports_each_item(self):
+        def fail():
+            raise OSError("boom")
+
+        results = run_batch([item("a"), item("b", run=fail), item("c", run=lambda: ([], False))])
+
+        self.assertEqual([(r.findings, r.success) for r in results], [(["a"], True), ([], False), ([], False)])
+        self.assertIsInstance(results[1].error, OSError)
+        self.assertIsNone(results[2].error)
+
+
+class TestBatchPipeline(unittest.TestCase):
+    def test_idle_workers_close_batches_early(self):
+        batches = list(stream_batches([item(str(i)) for i in range(10)], budget=10 ** 9, workers_idle=lambda: True))
+        self.assertEqual([len(b) for b in batches], [1] * 10)
+
+    def test_discovery_is_bounded_by_in_flight_batches(self):
+        pipeline = BatchPipeline(max_workers=1)
+        seen = []
+
+        def items():
+            for i in range(50):
+                seen.append(i)
+                yield item(str(i))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batches = stream_batches(pipeline.discover(items()), budget=1)
+            completed = pipeline.run(batches, submit=lambda b: executor.submit(run_batch, b), collect=lambda f: f.result())
+            next(completed)
+            discovered_early = len(seen)
+            rest = list(completed)
+
+        self.assertLess(discovered_early, 50)
+        self.assertEqual(len(rest), 49)
+        self.assertEqual(pipeline.total, 50)
+
+
+class TestBatchedScan(unittest.TestCase):
+    def test_failures_are_reported_per_item(self):
+        scanner = FilesystemScanner(load_runtime_config(), CLIArgs(max_workers=1), ".")
+        items = [item("ok.env"), item("failed.env", run=lambda: ([], False)), item("other.env")]
+
+        with patch("builtins.print"), self.assertLogs("secrets_hunter.scan_modes.base.scanner") as logs:
+            findings, success = scanner.scan_work_items(items, "found", "empty", "done", "file")
+
+        self.assertTrue(success)
+        self.assertEqual(sorted(findings), ["ok.env", "other.env"])
+        self.assertTrue(any("Error scanning file failed.env" in line for line in logs.output))
+        self.assertTrue(any("with 1 file(s) skipped" in line for line in logs.output))
+
+    def test_streamed_items_are_scanned(self):
+        scanner = FilesystemScanner(load_runtime_config(), CLIArgs(max_workers=2), ".")
+        items = (item(f"{i}.env") for i in range(30))
+
+        with patch("builtins.print"), patch("sys.stdout"):
+            findings, success = scanner.scan_work_items(items, None, "empty", "done", "file")
+
+        self.assertTrue(success)
+        self.assertEqual(sorted(findings), sorted(f"{i}.env" for i in range(30)))
@@ -140,6 +140,16 @@ class TestCLIParse(unittest.TestCase):
                 args = self.parse_ok(["secrets-hunter", "scan", "--workers", str(val)])
                 self.assertEqual(args.workers, val)
 
+    def test_walk_workers_must_be_positive(self):
+        self.assertParseError(["secrets-hunter", "scan", "--walk-workers", "0"], "--walk-workers must be > 0")
+        args = self.parse_ok(["secrets-hunter", "scan", "--walk-workers", "16"])
+        self.assertEqual(args.walk_workers, 16)
+
+    def test_line_window_size_must_cover_two_overlaps(self):
+        self.assertParseError(["secrets-hunter", "scan", "--line-window-size", "100"], "--line-window-size must be >= 2048")
+        args = self.parse_ok(["secrets-hunter", "scan", "--line-window-size", "4096"])
+        self.assertEqual(args.line_window_size, 4096)
+
     # ---------------- validator: min-confidence ----------------
     def test_min_confidence_invalid_values(self):
         cases = [
@@ -214,6 +224,24 @@ class TestCLIParse(unittest.TestCase):
         args = self.parse_ok(["secrets-hunter", "scan", "--log-level", "DEBUG"])
         self.assertEqual(args.log_level, "DEBUG")
 
+    def test_pattern_engine_valid_choice(self):
+        args = self.parse_ok(["secrets-hunter", "scan", "--pattern-engine", "combined"])
+        self.assertEqual(args.pattern_engine, "combined")
+
+    def test_invalid_choice_pattern_engine_errors(self):
+        self.assertParseError(
+            ["secrets-hunter", "scan", "--pattern-engine", "nope"],
+            "invalid choice"
+        )
+
+    def test_scan_engine_valid_choice(self):
+        args = self.parse_ok(["secrets-hunter", "scan", "--scan-engine", "buffer"])
+        self.assertEqual(args.scan_engine, "buffer")
+
+    def test_executor_valid_choice(self):
+        args = self.parse_ok(["secrets-hunter", "scan", "--executor", "process"])
+        self.assertEqual(args.executor, "process")
+
     # ---------------- validator: config files ----------------
     def test_config_must_exist(self):
         with tempfile.TemporaryDirectory() as td:
@@ -315,6 +343,16 @@ class TestCLIParse(unittest.TestCase):
             "--git-max-count requires --git-revset"
         )
 
+    def test_git_added_lines_only_requires_git_revset(self):
+        self.assertParseError(
+            ["secrets-hunter", "scan", ".", "--git-added-lines-only"],
+            "--git-added-lines-only requires --git-revset"
+        )
+
+    def test_git_added_lines_only_valid(self):
+        args = self.parse_ok(["secrets-hunter", "scan", ".", "--git-revset", "HEAD", "--git-added-lines-only"])
+        self.assertTrue(args.git_added_lines_only)
+
     def test_git_revset_and_max_count_valid(self):
         args = self.parse_ok([
             "secrets-hunter", "scan", ".",
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+from secrets_hunter.filters import PathFilter
+from secrets_hunter.scan_modes.filesystem.walker import DirectoryWalker
+
+
+class FlakyEntry:
+    """A DirEntry that counts stat calls and fails for one name, like an entry removed mid-listing."""
+
+    def __init__(self, entry, failing_name: str, stat_calls: list[str]):
+        self._entry = entry
+        self._failing_name = failing_name
+        self._stat_calls = stat_calls
+        self.name = entry.name
+
+    def _check(self):
+        if self.name == self._failing_name:
+            raise FileNotFoundError(self.name)
+
+    def is_dir(self):
+        self._check()
+        return self._entry.is_dir()
+
+    def is_file(self):
+        self._check()
+        return self._entry.is_file()
+
+    def is_symlink(self):
+        return self._entry.is_symlink()
+
+    def inode(self):
+        return self._entry.inode()
+
+    def stat(self):
+        self._stat_calls.append(self.name)
+        return self._entry.stat()
+
+
+class TestDirectoryWalker(unittest.TestCase):
+    def setUp(self):
+        self.td = tempfile.TemporaryDirectory()
+        self.root = Path(self.td.name)
+
+        for d in ("a/b/c", "a/d", "node_modules/x", "e"):
+            (self.root / d).mkdir(parents=True)
+
+        for f in ("a/one.txt", "a/b/two.txt", "a/b/c/three.txt", "a/d/four.txt", "node_modules/x/skip.txt", "e/five.txt"):
+            (self.root / f).write_text("value = 1\n", encoding="utf-8")
+
+        (self.root / "a" / "b" / "c" / "loop").symlink_to(self.root / "a")
+
+    def tearDown(self):
+        self.td.cleanup()
+
+    def walk(self, workers: int) -> list[Path]:
+        walker = DirectoryWalker(PathFilter(set(), set(), {"node_modules"}), workers)
+        return list(walker.walk(self.root))
+
+    def test_symlink_loops_are_entered_once(self):
+        files = self.walk(1)
+
+        self.assertEqual(len(files), 5)
+        self.assertEqual(
+            {f.relative_to(self.root).as_posix() for f in files},
+            {"a/one.txt", "a/b/two.txt", "a/b/c/three.txt", "a/d/four.txt", "e/five.txt"}
+        )
+
+    def test_parallel_walk_finds_the_same_files(self):
+        self.assertEqual(sorted(self.walk(4)), sorted(self.walk(1)))
+
+    @unittest.skipUnless(hasattr(os, "getuid") and os.getuid() != 0, "root can read unreadable dirs")
+    def test_unreadable_dirs_are_skipped(self):
+        (self.root / "e").chmod(0)
+
+        try:
+            self.assertNotIn(self.root / "e" / "five.txt", self.walk(2))
+        finally:
+            (self.root / "e").chmod(0o755)
+
+    def walk_flaky(self, failing_name: str) -> tuple[list[Path], list[str]]:
+        stat_calls: list[str] = []
+        real_scandir = os.scandir
+
+        class Entries:
+            def __init__(self, path):
+                self._entries = real_scandir(path)
+
+            def __enter__(self):
+                return self
+
+            def __iter__(self):
+                return (FlakyEntry(entry, failing_name, stat_calls) for entry in self._entries)
+
+            def __exit__(self, *exc):
+                self._entries.close()
+
+        with patch("secrets_hunter.scan_modes.filesystem.walker.os.scandir", Entries):
+            return self.walk(1), stat_calls
+
+    def test_only_symlinked_dirs_are_stated(self):
+        files, stat_calls = self.walk_flaky("")
+
+        self.assertEqual(len(files), 5)
+        self.assertEqual(stat_calls, ["loop"])
+
+    def test_failing_entry_does_not_drop_its_siblings(self):
+        files, _ = self.walk_flaky("b")
+
+        self.assertEqual(
+            {f.relative_to(self.root).as_posix() for f in files},
+            {"a/one.txt", "a/d/four.txt", "e/five.txt"}
+        )
@@ -0,0 +1,82 @@
+import subprocess
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from secrets_hunter.config import CLIArgs
+from secrets_hunter.models.config import RuntimeConfig
+from secrets_hunter.scan_modes.filesystem.git_files import GitFileLister
+from secrets_hunter.scan_modes.filesystem.scanner import FilesystemScanner
+
+
+def runtime_config_with_ignores() -> RuntimeConfig:
+    return RuntimeConfig(
+        secret_patterns={},
+        exclude_patterns=[],
+        exclude_keywords=[],
+        secret_keywords=[],
+        assignment_patterns=[],
+        ignore_files=(),
+        ignore_extensions=(),
+        ignore_dirs=("vendor",)
+    )
+
+
+class TestGitFileLister(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name)
+        self._git("init")
+
+        files = {
+            ".gitignore": "build/\n*.log\n",
+            "tracked.env": "A=1\n",
+            "untracked.env": "B=1\n",
+            "debug.log": "C=1\n",
+            "build/out.env": "D=1\n",
+            "local/notes.env": "E=1\n",
+            "vendor/lib.env": "F=1\n",
+        }
+
+        for name, contents in files.items():
+            path = self.repo / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(contents, encoding="utf-8")
+
+        (self.repo / ".git" / "info").mkdir(parents=True, exist_ok=True)
+        (self.repo / ".git" / "info" / "exclude").write_text("local/\n", encoding="utf-8")
+        self._git("add", ".gitignore", "tracked.env", "vendor/lib.env")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _git(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True, text=True)
+
+    def test_lists_tracked_and_untracked_files_not_ignored(self):
+        self.assertTrue(GitFileLister.is_work_tree(self.repo))
+        self.assertEqual(
+            {p.relative_to(self.repo).as_posix() for p in GitFileLister.iter_files(self.repo)},
+            {".gitignore", "tracked.env", "untracked.env", "vendor/lib.env"}
+        )
+
+    def test_scanner_respects_gitignore_only_when_asked(self):
+        default = FilesystemScanner(runtime_config_with_ignores(), CLIArgs(), str(self.repo))
+        gitignore = FilesystemScanner(runtime_config_with_ignores(), CLIArgs(respect_gitignore=True), str(self.repo))
+
+        default_files = {p.name for p in default.collect_files_to_scan(self.repo)}
+        gitignore_files = {p.name for p in gitignore.collect_files_to_scan(self.repo)}
+
+        self.assertIn("out.env", default_files)
+        self.assertEqual(gitignore_files, {".gitignore", "tracked.env", "untracked.env"})
+
+    def test_non_git_directory_falls_back_to_walking(self):
+        with tempfile.TemporaryDirectory() as td:
+            (Path(td) / "a.env").write_text("A=1\n", encoding="utf-8")
+            scanner = FilesystemScanner(runtime_config_with_ignores(), CLIArgs(respect_gitignore=True), td)
+
+            with self.assertLogs("secrets_hunter.scan_modes.filesystem.scanner", level="WARNING"):
+                files = scanner.collect_files_to_scan(Path(td))
+
+        self.assertEqual([p.name for p in files], ["a.env"])
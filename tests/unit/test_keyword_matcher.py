@@ -0,0 +1,49 @@
+import unittest
+
+from secrets_hunter.config import load_runtime_config
+from secrets_hunter.detection.false_positive_validator import FalsePositiveFindingsValidator
+from secrets_hunter.detection.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_returns_none_without_match(self):
+        matcher = KeywordMatcher(["secret", "token"], automaton_min_keywords=0)
+        self.assertIsNone(matcher.first_match("username"))
+
+    def test_first_listed_keyword_wins_over_leftmost_occurrence(self):
+        matcher = KeywordMatcher(["token", "api"], automaton_min_keywords=0)
+        self.assertEqual(matcher.first_match("api_token"), "token")
+
+    def test_matches_keywords_sharing_suffixes(self):
+        matcher = KeywordMatcher(["she", "he", "hers"], automaton_min_keywords=0)
+        self.assertEqual(matcher.first_match("ushers"), "she")
+        self.assertEqual(matcher.first_match("xhers"), "he")
+
+    def test_empty_keyword_matches_everything(self):
+        matcher = KeywordMatcher(["secret", ""], automaton_min_keywords=0)
+        self.assertEqual(matcher.first_match("anything"), "")
+        self.assertEqual(matcher.first_match("my_secret"), "secret")
+
+    def test_matches_substring_loop_for_packaged_keywords(self):
+        cfg = load_runtime_config()
+        variables = ["github_token", "db_password", "patch_version", "user_name", "authorization", ""]
+
+        for min_keywords in (0, len(cfg.secret_keywords) + 1):
+            matcher = KeywordMatcher(cfg.secret_keywords, automaton_min_keywords=min_keywords)
+
+            for variable in variables:
+                with self.subTest(min_keywords=min_keywords, variable=variable):
+                    expected = next((k for k in cfg.secret_keywords if k in variable), None)
+                    self.assertEqual(matcher.first_match(variable), expected)
+
+    def test_short_lists_are_matched_without_an_automaton(self):
+        self.assertIsNone(KeywordMatcher(["secret"], automaton_min_keywords=2)._delta)
+        self.assertIsNotNone(KeywordMatcher(["secret", "token"], automaton_min_keywords=2)._delta)
+
+
+class TestExcludeKeywordRejection(unittest.TestCase):
+    def test_rejects_on_lowercased_exclude_keyword(self):
+        validator = FalsePositiveFindingsValidator([], ["Integrity", "", "hash"], None)
+
+        self.assertEqual(validator.check_rejection_for_keywords(["name", "ASSET_INTEGRITY"]), (True, "integrity"))
+        self.assertEqual(validator.check_rejection_for_keywords(["api_key", None]), (False, ""))
@@ -0,0 +1,65 @@
+import pickle
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from secrets_hunter.config import CLIArgs, load_runtime_config
+from secrets_hunter.scan_modes.base.worker import pack_findings, unpack_findings
+from secrets_hunter.scan_modes.domain.scanner import DomainScanner
+from secrets_hunter.scan_modes.filesystem.scanner import FilesystemScanner
+
+TOKEN = "qF7xN2pL9vR4sT8mK3zY6dH1wC5bJ0uA"
+
+
+def finding_key(finding):
+    return finding.file, finding.line, finding.type, finding.match
+
+
+class TestProcessExecutor(unittest.TestCase):
+    def setUp(self):
+        self.cfg = load_runtime_config()
+        self.td = tempfile.TemporaryDirectory()
+        root = Path(self.td.name)
+
+        for i in range(4):
+            (root / f"service{i}.env").write_text(
+                f'API_KEY="{TOKEN}"\nAWS_KEY=AKIAIOSFODNN7EXAMPL{i}\nDEBUG=true\n', encoding="utf-8"
+            )
+
+    def tearDown(self):
+        self.td.cleanup()
+
+    def scan(self, executor: str):
+        scanner = FilesystemScanner(self.cfg, CLIArgs(executor=executor, max_workers=2), self.td.name)
+        findings, success = scanner.scan()
+        return sorted(findings, key=finding_key), success, scanner.detection_engine.stats.snapshot()
+
+    def test_process_executor_matches_threads(self):
+        thread_findings, thread_success, thread_stats = self.scan("thread")
+        process_findings, process_success, process_stats = self.scan("process")
+
+        self.assertTrue(thread_success and process_success)
+        self.assertEqual(process_findings, thread_findings)
+        self.assertGreater(len(process_findings), 0)
+        self.assertEqual(process_stats["gate_passed"], thread_stats["gate_passed"])
+
+    def test_work_item_tasks_are_picklable(self):
+        scanner = FilesystemScanner(self.cfg, CLIArgs(executor="process"), self.td.name)
+        items = scanner.collect_work_items()
+
+        self.assertTrue(scanner.uses_worker_processes())
+        self.assertEqual(pickle.loads(pickle.dumps([item.task for item in items])), [item.task for item in items])
+        self.assertIsInstance(pickle.loads(pickle.dumps(scanner.worker_spec())).build(), FilesystemScanner)
+
+    def test_packed_findings_round_trip(self):
+        scanner = FilesystemScanner(self.cfg, CLIArgs(), self.td.name)
+        findings, _ = scanner.scan_file(Path(self.td.name) / "service0.env")
+
+        self.assertEqual(unpack_findings(pickle.loads(pickle.dumps(pack_findings(findings)))), findings)
+
+    def test_domain_scans_stay_on_threads(self):
+        scanner = DomainScanner(self.cfg, CLIArgs(executor="process"), "example.com")
+
+        with self.assertLogs("secrets_hunter.scan_modes.base.scanner", level="WARNING"):
+            self.assertFalse(scanner.uses_worker_processes())
@@ -0,0 +1,34 @@
+import unittest
+
+from secrets_hunter.detection.semantics import StringSemanticsClassifier, StringKind
+from secrets_hunter.detection.semantics.bigrams import BIGRAM_MODEL, BIGRAM_TABLE
+
+
+class TestStringSemanticsClassifier(unittest.TestCase):
+    def setUp(self):
+        self.classifier = StringSemanticsClassifier()
+
+    def test_split_tokens(self):
+        self.assertEqual(
+            StringSemanticsClassifier.split_tokens("parseHTTPResponse_body-v2.json"),
+            ["parse", "HTTP", "Response", "body", "v2", "json"]
+        )
+
+    def test_bigram_table_matches_model(self):
+        self.assertEqual(len(BIGRAM_TABLE), 26 * 26)
+        self.assertEqual(BIGRAM_TABLE[(ord("t") - 97) * 26 + ord("h") - 97], BIGRAM_MODEL[("t", "h")])
+
+    def test_classifies_words_and_random_strings(self):
+        self.assertIs(self.classifier.classify("database_password_placeholder").kind, StringKind.STRUCTURED)
+        self.assertIs(self.classifier.classify("qF7xN2pL9vR4sT8mK3zY6dH1wC5bJ0uA").kind, StringKind.RANDOM)
+
+    def test_classify_is_memoized(self):
+        first = self.classifier.classify("changeme_later")
+        self.assertIs(self.classifier.classify("changeme_later"), first)
+
+    def test_classify_many_matches_classify(self):
+        strings = ["your_api_key_here", "x9Qz2LmP0vB7", ""]
+        self.assertEqual(
+            self.classifier.classify_many(strings),
+            [StringSemanticsClassifier().classify(s) for s in strings]
+        )
@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from secrets_hunter.config.settings import FileSettings
+from secrets_hunter.validators import TextContentValidator
+
+
+def reference_is_text(content: bytes) -> bool:
+    chunk = content[:FileSettings.BINARY_DETECTION_CHUNK_SIZE]
+
+    if not chunk:
+        return True
+
+    if b'\x00' in chunk:
+        return False
+
+    bad = sum(1 for b in chunk if b == 127 or (b < 32 and b not in (9, 10, 13)))
+    return (bad / len(chunk)) < FileSettings.CONTROL_CHARS_RATIO_THRESHOLD
+
+
+class TestTextContentValidator(unittest.TestCase):
+    def test_plain_text_and_empty_content_are_text(self):
+        self.assertTrue(TextContentValidator.is_text_content(b""))
+        self.assertTrue(TextContentValidator.is_text_content(b"API_KEY = 'value'\r\n\tnext\n"))
+
+    def test_null_byte_is_binary(self):
+        self.assertFalse(TextContentValidator.is_text_content(b"text\x00text"))
+
+    def test_control_bytes_ratio_threshold(self):
+        # 5 control bytes in 100 reaches the 5% threshold, 4 stays below it
+        self.assertFalse(TextContentValidator.is_text_content(b"\x1b" * 5 + b"a" * 95))
+        self.assertTrue(TextContentValidator.is_text_content(b"\x7f" * 4 + b"a" * 96))
+
+    def test_only_the_detection_chunk_is_inspected(self):
+        content = b"a" * FileSettings.BINARY_DETECTION_CHUNK_SIZE + b"\x00"
+        self.assertTrue(TextContentValidator.is_text_content(content))
+
+    def test_matches_reference_decision(self):
+        rng = random.Random(7)
+        alphabet = list(range(1, 32)) + [127] + list(b"abc =\n\t\r")
+
+        for _ in range(500):
+            size = rng.choice([1, 20, 300, 2048, 3000])
+            content = bytes(rng.choice(alphabet) if rng.random() < 0.08 else rng.choice(b"xyz ") for _ in range(size))
+
+            self.assertEqual(TextContentValidator.is_text_content(content), reference_is_text(content))